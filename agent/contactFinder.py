@@ -1,27 +1,168 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 import time
 import csv
 from urllib.parse import urljoin, urlparse
+from html.parser import HTMLParser
 import logging
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Tuple
 import os
 import json
+import socket
+from bisect import bisect_right
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 
 load_dotenv()
 
-class RealContactFinder:
+# Prefer the much faster lxml parser when it is installed
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# Optional single-pass multi-keyword matcher
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional HTTP/2 client for multiplexing Google API calls
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Only parse the parts of a page that can hold contact text or mailto links
+_CONTACT_STRAINER = SoupStrainer(['a', 'p', 'div', 'span', 'li', 'td', 'address', 'footer', 'section'])
+
+# Linear-time regex engine for scanning large pages, when installed
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Precompiled patterns shared by every finder instance
+_EMAIL_PATTERN = r'[A-Za-z0-9._%+\-]+@[A-Za-z0-9][A-Za-z0-9.\-]*\.[A-Za-z]{2,24}'
+_EMAIL_RE = re2.compile(_EMAIL_PATTERN) if re2 is not None else re.compile(_EMAIL_PATTERN)
+_NAME_RE = re.compile(r'\b[A-Z][a-z]+ [A-Z][a-z]+\b')
+_MAILTO_HREF_RE = re.compile(r'^mailto:([^?&\s]+)')
+_LINKEDIN_TITLE_RE = re.compile(
+    r'(HR Manager|Talent Acquisition|Recruiter|Hiring Manager'
+    r'|Head of Talent|People Operations|HR Director'
+    r'|Recruitment|Staffing|Human Resources)',
+    re.IGNORECASE
+)
+
+class EmailExtractor(HTMLParser):
+    # Buffered text is scanned once it grows past this many characters
+    FLUSH_SIZE = 8192
+    # Trailing characters kept between scans so an email split across chunks is not lost
+    OVERLAP = 256
+    
     def __init__(self):
+        """Streaming HTML parser collecting emails from page text and mailto links without building a DOM"""
+        super().__init__(convert_charrefs=True)
+        self.emails: List[str] = []
+        self._buffer: List[str] = []
+        self._buffered = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag != 'a':
+            return
+            
+        for name, value in attrs:
+            if name == 'href' and value:
+                email_match = _MAILTO_HREF_RE.match(value)
+                if email_match:
+                    self.emails.append(email_match.group(1))
+    
+    def handle_data(self, data):
+        self._buffer.append(data)
+        self._buffered += len(data)
+        
+        if self._buffered > self.FLUSH_SIZE:
+            self._scan()
+    
+    def close(self):
+        super().close()
+        self._scan(final=True)
+    
+    def _scan(self, final: bool = False):
+        """
+        Extract emails from the buffered text, keeping a tail that may hold a partial email
+        """
+        text = ''.join(self._buffer)
+        cut = len(text)
+        
+        if not final:
+            # Emails never contain whitespace, so cut the buffer at a whitespace boundary
+            cut = max(0, len(text) - self.OVERLAP)
+            floor = max(0, cut - self.OVERLAP)
+            while cut > floor and not text[cut - 1].isspace():
+                cut -= 1
+        
+        for match in _EMAIL_RE.finditer(text):
+            if match.end() >= cut and not final:
+                # The match may continue in the next chunk; rescan it then
+                cut = min(cut, match.start())
+                break
+            self.emails.append(match.group(0))
+            
+        tail = '' if final else text[cut:]
+        self._buffer = [tail]
+        self._buffered = len(tail)
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        """Thread-safe token bucket allowing `rate` calls per second with bursts of up to `burst`"""
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """
+        Block until a token is available, then consume it
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                    
+                wait = (1 - self.tokens) / self.rate
+                
+            time.sleep(wait)
+
+class RealContactFinder:
+    def __init__(self, use_cache: bool = True):
         """Initialize the ContactFinder with configuration for real email hunting"""
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         
+        # Keep connections alive across concurrent workers and retry transient failures
+        self.retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=self.retries)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Email regex pattern
-        self.email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+        self.email_pattern = _EMAIL_RE
         
         # Keywords that indicate recruiter/HR roles
         self.hr_keywords = [
@@ -32,16 +173,70 @@ class RealContactFinder:
             'recruitment', 'staffing', 'talent management', 'campus placement'
         ]
         
+        # Match every HR keyword in one pass over the text (regex alternation without pyahocorasick)
+        if ahocorasick is not None:
+            self._hr_automaton = ahocorasick.Automaton()
+            for keyword in self.hr_keywords:
+                self._hr_automaton.add_word(keyword.lower(), keyword)
+            self._hr_automaton.make_automaton()
+            self._hr_keyword_re = None
+        else:
+            self._hr_automaton = None
+            self._hr_keyword_re = re.compile('|'.join(re.escape(keyword.lower()) for keyword in self.hr_keywords))
+        
+        # Mailbox names that indicate an HR inbox
+        self.hr_local_parts = frozenset({
+            'hr', 'careers', 'jobs', 'talent', 'recruiting', 'recruitment'
+        })
+        
+        # Generic/automated mailbox names to exclude
+        self.excluded_local_parts = frozenset({
+            'noreply', 'no-reply', 'donotreply', 'support', 'info',
+            'admin', 'webmaster', 'hello', 'contact', 'sales'
+        })
+        
+        # Personal email providers
+        self.personal_domains = frozenset({'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com'})
+        
         # Set up logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
         
         # Store found contacts to avoid duplicates
-        self.found_contacts: Set[str] = set()
+        # (sharded so concurrent workers rarely contend on the same lock)
+        self._found_shard_count = 16
+        self._found_shards: List[Set[str]] = [set() for _ in range(self._found_shard_count)]
+        self._found_locks = [threading.Lock() for _ in range(self._found_shard_count)]
+        
+        # Maximum number of companies processed concurrently
+        self.max_workers = 8
         
         # Google Custom Search API endpoint
         self.google_search_url = "https://www.googleapis.com/customsearch/v1"
         
+        # Multiplex concurrent Google API calls over one HTTP/2 connection when available
+        # (opened for each find_real_hr_emails run; the session is used otherwise)
+        self._cse_client = None
+        
+        # Rate limiters shared by all worker threads: one for the Google API
+        # (kept under its per-minute quota) and one per scraped website host
+        self.google_limiter = TokenBucket(rate=90 / 60, burst=10)
+        self.host_rate = 2
+        self.host_burst = 4
+        self._host_limiters: Dict[str, TokenBucket] = {}
+        self._host_limiters_lock = threading.Lock()
+        
+        # Whether the data/ output directory is known to exist
+        self._data_dir_ready = False
+        
+        # Google CSE response cache (LRU in memory, persisted to disk between runs)
+        self.use_cache = use_cache
+        self.search_cache_file = os.path.join("data", "cse_cache.json")
+        self.search_cache_ttl = 86400  # seconds
+        self.search_cache_size = 4096
+        self._search_cache_lock = threading.Lock()
+        self._search_cache: OrderedDict = self._load_search_cache() if use_cache else OrderedDict()
+        
         # Known Indian fintech companies with their actual domains
         self.indian_fintech_companies = [
             {'name': 'Paytm', 'domain': 'paytm.com', 'website': 'https://paytm.com'},
@@ -57,26 +252,149 @@ class RealContactFinder:
             {'name': 'Mobikwik', 'domain': 'mobikwik.com', 'website': 'https://mobikwik.com'},
             {'name': 'Capital Float', 'domain': 'capitalfloat.com', 'website': 'https://capitalfloat.com'}
         ]
+        
+        # Intern domains, which are compared against every candidate email
+        for company in self.indian_fintech_companies:
+            company['domain'] = sys.intern(company['domain'])
+    
+    def _build_http2_client(self):
+        """
+        Create an HTTP/2 client for the Google API, or None if httpx[http2] is not installed
+        """
+        if httpx is None:
+            return None
+            
+        try:
+            # Transport-level retries cover connection failures; _cse_get retries error statuses
+            transport = httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+                retries=self.retries.total
+            )
+            return httpx.Client(transport=transport, timeout=15)
+        except ImportError:
+            # HTTP/2 support needs the optional h2 package
+            return None
     
     def google_custom_search(self, query: str, api_key: str, cse_id: str, num: int = 10) -> Dict:
         """
         Perform Google Custom Search API request
         """
+        num = min(num, 10)
+        cache_key = f"{num}|{query}"
+        
+        if self.use_cache:
+            cached = self._get_cached_search(cache_key)
+            if cached is not None:
+                return cached
+        
         params = {
             'key': api_key,
             'cx': cse_id,
             'q': query,
-            'num': min(num, 10),
+            'num': num,
             'gl': 'in'
         }
         
         try:
-            response = requests.get(self.google_search_url, params=params)
+            self.google_limiter.acquire()
+            if self._cse_client is not None:
+                response = self._cse_get(params)
+            else:
+                response = self.session.get(self.google_search_url, params=params, timeout=15)
             response.raise_for_status()
-            return response.json()
+            results = response.json()
         except Exception as e:
             self.logger.error(f"Google Search API error: {str(e)}")
             return {}
+            
+        if self.use_cache:
+            self._set_cached_search(cache_key, results)
+            
+        return results
+    
+    def _cse_get(self, params: Dict):
+        """
+        GET the Custom Search API over HTTP/2, retrying the statuses the session's Retry covers
+        """
+        for attempt in range(self.retries.total + 1):
+            response = self._cse_client.get(self.google_search_url, params=params)
+            if response.status_code not in self.retries.status_forcelist or attempt == self.retries.total:
+                return response
+                
+            # Honour Retry-After when Google sends one, otherwise back off exponentially
+            retry_after = response.headers.get('Retry-After', '')
+            delay = float(retry_after) if retry_after.isdigit() else self.retries.backoff_factor * 2 ** attempt
+            self.logger.warning(f"Google Search API returned {response.status_code}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+    
+    def _get_cached_search(self, cache_key: str):
+        """
+        Return a cached search response if present and not expired
+        """
+        with self._search_cache_lock:
+            entry = self._search_cache.get(cache_key)
+            if entry is None:
+                return None
+                
+            if time.time() - entry['fetched_at'] > self.search_cache_ttl:
+                del self._search_cache[cache_key]
+                return None
+                
+            self._search_cache.move_to_end(cache_key)
+            return entry['response']
+    
+    def _set_cached_search(self, cache_key: str, response: Dict):
+        """
+        Store a search response, evicting the least recently used entries
+        """
+        with self._search_cache_lock:
+            self._search_cache[cache_key] = {'fetched_at': time.time(), 'response': response}
+            self._search_cache.move_to_end(cache_key)
+            
+            while len(self._search_cache) > self.search_cache_size:
+                self._search_cache.popitem(last=False)
+    
+    def _load_search_cache(self) -> OrderedDict:
+        """
+        Load unexpired search responses from the on-disk cache
+        """
+        cache = OrderedDict()
+        
+        if not os.path.exists(self.search_cache_file):
+            return cache
+            
+        try:
+            with open(self.search_cache_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable search cache {self.search_cache_file}: {str(e)}")
+            return cache
+            
+        now = time.time()
+        for key, entry in entries.items():
+            if now - entry.get('fetched_at', 0) <= self.search_cache_ttl:
+                cache[key] = entry
+                
+        return cache
+    
+    def save_search_cache(self):
+        """
+        Persist the search cache to disk
+        """
+        if not self.use_cache:
+            return
+            
+        with self._search_cache_lock:
+            entries = dict(self._search_cache)
+            
+        self._ensure_data_dir()
+        
+        try:
+            with open(self.search_cache_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+        except Exception as e:
+            self.logger.warning(f"Could not save search cache: {str(e)}")
     
     def find_real_hr_emails(self, api_key: str, cse_id: str, max_companies: int = 6) -> List[Dict]:
         """
@@ -89,66 +407,177 @@ class RealContactFinder:
         
         self.logger.info(f"Processing {len(companies)} Indian fintech companies")
         
-        for i, company in enumerate(companies, 1):
-            self.logger.info(f"Processing company {i}/{len(companies)}: {company['name']}")
-            
-            company_contacts = []
+        if not companies:
+            return all_contacts
+        
+        # Resolve every host up front so concurrent workers don't repeat lookups
+        self._preresolve_hosts(companies)
+        
+        self._cse_client = self._build_http2_client()
+        try:
+            # Companies are independent and I/O-bound, so process them concurrently
+            with ThreadPoolExecutor(max_workers=min(len(companies), self.max_workers)) as executor:
+                futures = {
+                    executor.submit(self._process_company, company, api_key, cse_id): company
+                    for company in companies
+                }
+                
+                for i, future in enumerate(as_completed(futures), 1):
+                    company = futures[future]
+                    try:
+                        company_contacts = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Error processing {company['name']}: {str(e)}")
+                        continue
+                        
+                    all_contacts.extend(company_contacts)
+                    
+                    self.logger.info(f"Found {len(company_contacts)} real contacts for {company['name']} ({i}/{len(companies)} companies done)")
+        finally:
+            if self._cse_client is not None:
+                self._cse_client.close()
+                self._cse_client = None
+        
+        self.save_search_cache()
             
-            # Method 1: Search for specific HR contacts at the company
-            search_contacts = self._search_real_hr_contacts(company, api_key, cse_id)
-            company_contacts.extend(search_contacts)
+        return all_contacts
+    
+    def _preresolve_hosts(self, companies: List[Dict]):
+        """
+        Warm the resolver cache for the Google API and company website hosts
+        """
+        hosts = {urlparse(self.google_search_url).hostname}
+        hosts.update(urlparse(company['website']).hostname for company in companies)
+        
+        def resolve(host):
+            try:
+                socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+            except OSError as e:
+                self.logger.warning(f"Could not resolve {host}: {str(e)}")
+        
+        with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+            list(executor.map(resolve, hosts))
+    
+    def _process_company(self, company: Dict, api_key: str, cse_id: str) -> List[Dict]:
+        """
+        Run every contact discovery method for a single company
+        """
+        self.logger.info(f"Processing company: {company['name']}")
+        
+        company_contacts = []
+        
+        # Issue every Google search for the company in one concurrent batch
+        search_results = self._run_company_searches(company, api_key, cse_id)
+        
+        # Method 1: Search for specific HR contacts at the company
+        search_contacts = self._extract_real_hr_contacts(company, search_results.get('hr_search', []))
+        company_contacts.extend(search_contacts)
+        
+        # Method 2: Scrape company careers page
+        careers_contacts = self._scrape_careers_page(company)
+        company_contacts.extend(careers_contacts)
+        
+        # Method 3: Search for LinkedIn profiles and extract contact info
+        linkedin_contacts = self._extract_linkedin_hr_contacts(company, search_results.get('linkedin', []), api_key, cse_id)
+        company_contacts.extend(linkedin_contacts)
+        
+        # Method 4: Search for job postings with contact info
+        job_contacts = self._extract_job_posting_contacts(company, search_results.get('job_posting', []))
+        company_contacts.extend(job_contacts)
+        
+        # Add company info to contacts
+        for contact in company_contacts:
+            contact.update({
+                'company': company['name'],
+                'company_domain': company['domain'],
+                'company_website': company['website'],
+                'country': 'india',
+                'industry': 'fintech'
+            })
             
-            # Method 2: Scrape company careers page
-            careers_contacts = self._scrape_careers_page(company)
-            company_contacts.extend(careers_contacts)
+        return company_contacts
+    
+    def _claim_email(self, email: str) -> bool:
+        """
+        Atomically mark an email as found; returns False if it was already seen
+        """
+        shard = hash(email) % self._found_shard_count
+        
+        with self._found_locks[shard]:
+            if email in self._found_shards[shard]:
+                return False
+            self._found_shards[shard].add(email)
+            return True
+    
+    @property
+    def found_contacts(self) -> Set[str]:
+        """
+        All emails found so far
+        """
+        found = set()
+        for shard, lock in zip(self._found_shards, self._found_locks):
+            with lock:
+                found.update(shard)
+        return found
+    
+    def _build_company_queries(self, company: Dict) -> List[Tuple[str, str, int]]:
+        """
+        Build every (tag, query, num) Google search used to discover contacts at a company
+        """
+        return [
+            # Specific search queries to find real HR contacts
+            ('hr_search', f'"{company["name"]}" HR email contact site:{company["domain"]}', 5),
+            ('hr_search', f'"{company["name"]}" recruiter email site:{company["domain"]}', 5),
+            ('hr_search', f'"{company["name"]}" careers contact email', 5),
+            ('hr_search', f'"{company["name"]}" talent acquisition email', 5),
+            ('hr_search', f'"{company["name"]}" hiring manager email', 5),
+            ('hr_search', f'site:{company["domain"]} "careers@" OR "hr@" OR "jobs@" OR "recruitment@"', 5),
             
-            # Method 3: Search for LinkedIn profiles and extract contact info
-            linkedin_contacts = self._find_linkedin_hr_contacts(company, api_key, cse_id)
-            company_contacts.extend(linkedin_contacts)
+            # HR professionals on LinkedIn
+            ('linkedin', f'"{company["name"]}" "HR" OR "Talent Acquisition" OR "Recruiter" site:linkedin.com/in india', 8),
             
-            # Method 4: Search for job postings with contact info
-            job_contacts = self._find_job_posting_contacts(company, api_key, cse_id)
-            company_contacts.extend(job_contacts)
+            # Job postings that might contain HR contact information
+            ('job_posting', f'"{company["name"]}" job posting "contact" "apply" email', 5)
+        ]
+    
+    def _run_company_searches(self, company: Dict, api_key: str, cse_id: str) -> Dict[str, List[Dict]]:
+        """
+        Run all Google searches for a company concurrently and group the results by tag
+        """
+        grouped_results: Dict[str, List[Dict]] = {}
+        
+        try:
+            # Deduplicate queries, remembering every tag that wants each result
+            query_tags: Dict[Tuple[str, int], List[str]] = {}
+            for tag, query, num in self._build_company_queries(company):
+                query_tags.setdefault((query, num), []).append(tag)
             
-            # Add company info to contacts
-            for contact in company_contacts:
-                contact.update({
-                    'company': company['name'],
-                    'company_domain': company['domain'],
-                    'company_website': company['website'],
-                    'country': 'india',
-                    'industry': 'fintech'
-                })
-                
-            all_contacts.extend(company_contacts)
+            unique_queries = list(query_tags)
             
-            self.logger.info(f"Found {len(company_contacts)} real contacts for {company['name']}")
+            # Queries are independent, so issue them concurrently
+            with ThreadPoolExecutor(max_workers=len(unique_queries)) as executor:
+                all_results = list(executor.map(
+                    lambda q: self.google_custom_search(q[0], api_key, cse_id, num=q[1]),
+                    unique_queries
+                ))
             
-            # Rate limiting
-            time.sleep(3)
+            for query_key, results in zip(unique_queries, all_results):
+                for tag in query_tags[query_key]:
+                    grouped_results.setdefault(tag, []).append(results)
+                    
+        except Exception as e:
+            self.logger.error(f"Error running Google searches for {company['name']}: {str(e)}")
             
-        return all_contacts
+        return grouped_results
     
-    def _search_real_hr_contacts(self, company: Dict, api_key: str, cse_id: str) -> List[Dict]:
+    def _extract_real_hr_contacts(self, company: Dict, search_results: List[Dict]) -> List[Dict]:
         """
-        Search for real HR contacts using specific queries
+        Extract real HR contacts from specific HR search results
         """
         contacts = []
         
         try:
-            # Specific search queries to find real HR contacts
-            search_queries = [
-                f'"{company["name"]}" HR email contact site:{company["domain"]}',
-                f'"{company["name"]}" recruiter email site:{company["domain"]}',
-                f'"{company["name"]}" careers contact email',
-                f'"{company["name"]}" talent acquisition email',
-                f'"{company["name"]}" hiring manager email',
-                f'site:{company["domain"]} "careers@" OR "hr@" OR "jobs@" OR "recruitment@"'
-            ]
-            
-            for query in search_queries:
-                results = self.google_custom_search(query, api_key, cse_id, num=5)
-                
+            for results in search_results:
                 if 'items' in results:
                     for item in results['items']:
                         snippet = item.get('snippet', '')
@@ -160,7 +589,7 @@ class RealContactFinder:
                         emails = self.email_pattern.findall(all_text)
                         
                         for email in emails:
-                            if self._is_real_hr_email(email, company['domain']) and email not in self.found_contacts:
+                            if self._is_real_hr_email(email, company['domain']) and self._claim_email(email):
                                 contact_info = self._extract_contact_details(all_text, email)
                                 contacts.append({
                                     'email': email,
@@ -170,9 +599,6 @@ class RealContactFinder:
                                     'source_url': link,
                                     'confidence': 'high'
                                 })
-                                self.found_contacts.add(email)
-                                
-                time.sleep(1)
                 
         except Exception as e:
             self.logger.error(f"Error searching real HR contacts for {company['name']}: {str(e)}")
@@ -196,39 +622,42 @@ class RealContactFinder:
                 f"{company['website']}/contact"
             ]
             
-            for url in careers_urls:
+            # Fetch all candidate pages concurrently; parsing stays on this thread
+            with ThreadPoolExecutor(max_workers=len(careers_urls)) as executor:
+                responses = list(executor.map(lambda u: (u, self._safe_get(u)), careers_urls))
+            
+            for url, response in responses:
+                if response is None or response.status_code != 200:
+                    continue
+                    
                 try:
-                    response = self.session.get(url, timeout=15)
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        
-                        # Look for contact sections, forms, or email links
-                        page_text = soup.get_text()
-                        emails = self.email_pattern.findall(page_text)
-                        
-                        # Also check for mailto links
-                        mailto_links = soup.find_all('a', href=re.compile(r'mailto:'))
-                        for link in mailto_links:
-                            href = link.get('href', '')
-                            email_match = re.search(r'mailto:([^?&\s]+)', href)
-                            if email_match:
-                                emails.append(email_match.group(1))
-                        
-                        for email in emails:
-                            if self._is_real_hr_email(email, company['domain']) and email not in self.found_contacts:
-                                # Try to find context around the email
-                                context = self._find_email_context_on_page(soup, email)
-                                contacts.append({
-                                    'email': email,
-                                    'name': context.get('name', ''),
-                                    'title': context.get('title', ''),
-                                    'source': 'Careers Page Scraping',
-                                    'source_url': url,
-                                    'confidence': 'high'
-                                })
-                                self.found_contacts.add(email)
-                                
-                    time.sleep(2)
+                    # Stream the page to find emails in its text and mailto links
+                    extractor = EmailExtractor()
+                    extractor.feed(response.text)
+                    extractor.close()
+                    
+                    emails = [email for email in extractor.emails if self._is_real_hr_email(email, company['domain'])]
+                    if not emails:
+                        continue
+                    
+                    # Only build the DOM when there are HR emails that need surrounding context
+                    soup = BeautifulSoup(response.content, _HTML_PARSER, parse_only=_CONTACT_STRAINER)
+                    
+                    # Index the page text once so every email lookup reuses it
+                    page = self._index_page_text(soup)
+                    
+                    for email in emails:
+                        if self._claim_email(email):
+                            # Try to find context around the email
+                            context = self._find_email_context_on_page(page, email)
+                            contacts.append({
+                                'email': email,
+                                'name': context.get('name', ''),
+                                'title': context.get('title', ''),
+                                'source': 'Careers Page Scraping',
+                                'source_url': url,
+                                'confidence': 'high'
+                            })
                     
                 except Exception as e:
                     self.logger.warning(f"Error scraping {url}: {str(e)}")
@@ -239,18 +668,41 @@ class RealContactFinder:
             
         return contacts
     
-    def _find_linkedin_hr_contacts(self, company: Dict, api_key: str, cse_id: str) -> List[Dict]:
+    def _get_host_limiter(self, url: str) -> TokenBucket:
+        """
+        Return the rate limiter for a URL's host, creating it on first use
+        """
+        host = urlparse(url).netloc
+        
+        with self._host_limiters_lock:
+            limiter = self._host_limiters.get(host)
+            if limiter is None:
+                limiter = TokenBucket(rate=self.host_rate, burst=self.host_burst)
+                self._host_limiters[host] = limiter
+            return limiter
+    
+    def _safe_get(self, url: str):
+        """
+        Fetch a URL with the shared session, returning None on failure
+        """
+        try:
+            self._get_host_limiter(url).acquire()
+            return self.session.get(url, timeout=15)
+        except Exception as e:
+            self.logger.warning(f"Error fetching {url}: {str(e)}")
+            return None
+    
+    def _extract_linkedin_hr_contacts(self, company: Dict, search_results: List[Dict], api_key: str, cse_id: str) -> List[Dict]:
         """
-        Find HR professionals on LinkedIn and try to get their contact info
+        Find HR professionals in LinkedIn search results and try to get their contact info
         """
         contacts = []
         
         try:
-            linkedin_query = f'"{company["name"]}" "HR" OR "Talent Acquisition" OR "Recruiter" site:linkedin.com/in india'
-            
-            results = self.google_custom_search(linkedin_query, api_key, cse_id, num=8)
-            
-            if 'items' in results:
+            for results in search_results:
+                if 'items' not in results:
+                    continue
+                    
                 for item in results['items']:
                     title = item.get('title', '')
                     snippet = item.get('snippet', '')
@@ -262,7 +714,7 @@ class RealContactFinder:
                         
                         # Check if it's actually HR related
                         combined_text = f"{title} {snippet}".lower()
-                        if any(keyword in combined_text for keyword in self.hr_keywords):
+                        if self._has_hr_keyword(combined_text):
                             
                             # Try to find associated email through additional search
                             email_search_query = f'"{name}" "{company["name"]}" email contact'
@@ -291,26 +743,23 @@ class RealContactFinder:
                                 'source_url': linkedin_url,
                                 'confidence': 'medium' if found_email else 'low'
                             })
-                            
-            time.sleep(2)
             
         except Exception as e:
             self.logger.error(f"Error finding LinkedIn HR contacts for {company['name']}: {str(e)}")
             
         return contacts
     
-    def _find_job_posting_contacts(self, company: Dict, api_key: str, cse_id: str) -> List[Dict]:
+    def _extract_job_posting_contacts(self, company: Dict, search_results: List[Dict]) -> List[Dict]:
         """
-        Search for job postings that might contain HR contact information
+        Extract HR contact information from job posting search results
         """
         contacts = []
         
         try:
-            job_query = f'"{company["name"]}" job posting "contact" "apply" email'
-            
-            results = self.google_custom_search(job_query, api_key, cse_id, num=5)
-            
-            if 'items' in results:
+            for results in search_results:
+                if 'items' not in results:
+                    continue
+                    
                 for item in results['items']:
                     snippet = item.get('snippet', '')
                     title = item.get('title', '')
@@ -321,7 +770,7 @@ class RealContactFinder:
                     emails = self.email_pattern.findall(all_text)
                     
                     for email in emails:
-                        if self._is_real_hr_email(email, company['domain']) and email not in self.found_contacts:
+                        if self._is_real_hr_email(email, company['domain']) and self._claim_email(email):
                             contacts.append({
                                 'email': email,
                                 'name': '',
@@ -330,7 +779,6 @@ class RealContactFinder:
                                 'source_url': link,
                                 'confidence': 'medium'
                             })
-                            self.found_contacts.add(email)
                             
         except Exception as e:
             self.logger.error(f"Error finding job posting contacts for {company['name']}: {str(e)}")
@@ -341,27 +789,31 @@ class RealContactFinder:
         """
         Check if email is a real HR email (not generated)
         """
-        email_lower = email.lower()
+        local_part, _, domain = email.lower().partition('@')
+        if not domain:
+            return False
         
-        # Must contain company domain or be from a known HR email pattern
-        is_company_email = company_domain in email_lower
-        
-        # HR indicators
-        hr_patterns = ['hr@', 'careers@', 'jobs@', 'talent@', 'recruiting@', 'recruitment@']
-        has_hr_pattern = any(pattern in email_lower for pattern in hr_patterns)
-        
-        # Exclude generic/automated emails
-        exclude_patterns = [
-            'noreply@', 'no-reply@', 'donotreply@', 'support@', 'info@', 
-            'admin@', 'webmaster@', 'hello@', 'contact@', 'sales@'
-        ]
-        is_excluded = any(pattern in email_lower for pattern in exclude_patterns)
+        # Reject personal emails (gmail, yahoo, etc.) and generic/automated emails first
+        if domain in self.personal_domains or local_part in self.excluded_local_parts:
+            return False
         
-        # Check for personal emails (gmail, yahoo, etc.)
-        personal_domains = ['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com']
-        is_personal = any(domain in email_lower for domain in personal_domains)
+        # Must be on the company domain (or a subdomain) or be a known HR mailbox
+        return (
+            domain == company_domain
+            or domain.endswith('.' + company_domain)
+            or local_part in self.hr_local_parts
+        )
+    
+    def _has_hr_keyword(self, text: str) -> bool:
+        """
+        Check whether text mentions any HR keyword
+        """
+        text_lower = text.lower()
         
-        return (is_company_email or has_hr_pattern) and not is_excluded and not is_personal
+        if self._hr_automaton is not None:
+            return next(self._hr_automaton.iter(text_lower), None) is not None
+            
+        return self._hr_keyword_re.search(text_lower) is not None
     
     def _extract_contact_details(self, text: str, email: str) -> Dict:
         """
@@ -369,49 +821,81 @@ class RealContactFinder:
         """
         details = {'name': '', 'title': ''}
         
-        # Look for patterns around the email
-        sentences = text.split('.')
-        for sentence in sentences:
-            if email in sentence:
-                # Look for name patterns (Title Case words)
-                names = re.findall(r'\b[A-Z][a-z]+ [A-Z][a-z]+\b', sentence)
-                if names:
-                    details['name'] = names[0]
+        # Look for patterns in a window of text around the email
+        index = text.find(email)
+        if index < 0:
+            return details
+            
+        window = text[max(0, index - 120):index + len(email) + 120]
+        
+        # Look for name patterns (Title Case words)
+        name_match = _NAME_RE.search(window)
+        if name_match:
+            details['name'] = name_match.group(0)
+        
+        # Look for title patterns
+        if self._has_hr_keyword(window):
+            details['title'] = window.strip()[:100]
                 
-                # Look for title patterns
-                for keyword in self.hr_keywords:
-                    if keyword.lower() in sentence.lower():
-                        details['title'] = sentence.strip()[:100]
-                        break
-                        
         return details
     
-    def _find_email_context_on_page(self, soup: BeautifulSoup, email: str) -> Dict:
+    def _index_page_text(self, soup: BeautifulSoup) -> Dict:
+        """
+        Build a flat text view of a page with the offset at which each text node starts
+        """
+        nodes = soup.find_all(string=True)
+        
+        offsets = []
+        position = 0
+        for node in nodes:
+            offsets.append(position)
+            position += len(node)
+            
+        return {
+            'nodes': nodes,
+            'offsets': offsets,
+            'text': ''.join(nodes),
+            'element_text': {}  # get_text() of parent elements, shared by all emails on the page
+        }
+    
+    def _find_email_context_on_page(self, page: Dict, email: str) -> Dict:
         """
-        Find context around an email on a webpage
+        Find context around an email on a webpage indexed by _index_page_text
         """
         context = {'name': '', 'title': ''}
         
-        # Find elements containing the email
-        email_elements = soup.find_all(string=re.compile(email))
+        page_text = page['text']
+        element_text = page['element_text']
+        visited = set()
         
-        for element in email_elements:
+        # Locate each occurrence in the flat text and map it back to its text node
+        start = page_text.find(email)
+        while start >= 0 and not (context['name'] and context['title']):
+            element = page['nodes'][bisect_right(page['offsets'], start) - 1]
+            start = page_text.find(email, start + len(email))
+            
+            if id(element) in visited:
+                continue
+            visited.add(id(element))
+            
             # Look at parent elements for context
             current = element.parent
             for _ in range(3):  # Check up to 3 parent levels
                 if current:
-                    text = current.get_text().strip()
+                    key = id(current)
+                    if key not in element_text:
+                        element_text[key] = current.get_text().strip()
+                    text = element_text[key]
                     
                     # Look for names
-                    name_matches = re.findall(r'\b[A-Z][a-z]+ [A-Z][a-z]+\b', text)
-                    if name_matches and not context['name']:
-                        context['name'] = name_matches[0]
+                    if not context['name']:
+                        name_match = _NAME_RE.search(text)
+                        if name_match:
+                            context['name'] = name_match.group(0)
                     
                     # Look for titles
-                    for keyword in self.hr_keywords:
-                        if keyword.lower() in text.lower() and not context['title']:
-                            context['title'] = text[:100]
-                            break
+                    if not context['title'] and self._has_hr_keyword(text):
+                        context['title'] = text[:100]
                             
                     current = current.parent
                 else:
@@ -423,20 +907,20 @@ class RealContactFinder:
         """
         Extract job title from LinkedIn snippet
         """
-        # Common patterns in LinkedIn snippets
-        title_patterns = [
-            r'(HR Manager|Talent Acquisition|Recruiter|Hiring Manager)',
-            r'(Head of Talent|People Operations|HR Director)',
-            r'(Recruitment|Staffing|Human Resources)'
-        ]
-        
-        for pattern in title_patterns:
-            match = re.search(pattern, snippet, re.IGNORECASE)
-            if match:
-                return match.group(1)
-                
+        match = _LINKEDIN_TITLE_RE.search(snippet)
+        if match:
+            return match.group(1)
+            
         return "HR Professional"
     
+    def _ensure_data_dir(self):
+        """
+        Create the data/ directory on first use only
+        """
+        if not self._data_dir_ready:
+            os.makedirs("data", exist_ok=True)
+            self._data_dir_ready = True
+    
     def save_contacts_to_csv(self, contacts: List[Dict], filename: str = None):
         """
         Save real contacts to CSV file
@@ -446,28 +930,26 @@ class RealContactFinder:
             return
             
         if not filename:
-            timestamp = int(time.time())
+            timestamp = time.time_ns() // 1_000_000
             filename = f"real_hr_contacts_{timestamp}.csv"
             
-        os.makedirs("data", exist_ok=True)
+        self._ensure_data_dir()
         filepath = os.path.join("data", filename)
         
         fieldnames = ['company', 'company_domain', 'industry', 'country', 'name', 'email', 
                      'title', 'linkedin_url', 'source', 'source_url', 'confidence', 'company_website']
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for contact in contacts:
-                row = {field: contact.get(field, '') for field in fieldnames}
-                writer.writerow(row)
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows(tuple(contact.get(field, '') for field in fieldnames) for contact in contacts)
                 
         self.logger.info(f"Saved {len(contacts)} real contacts to {filepath}")
         return filepath
 
 if __name__ == "__main__":
-    finder = RealContactFinder()
+    # Pass --no-cache to bypass cached Google search results
+    finder = RealContactFinder(use_cache='--no-cache' not in sys.argv)
     
     # Get API credentials from environment
     GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY')
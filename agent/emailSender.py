@@ -1,26 +1,279 @@
 import os
+import re
+import glob
 import base64
+import csv
 import json
 import logging
+from html import unescape
 import pandas as pd
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
-from typing import List, Dict, Optional
+from email import policy
+from email.message import EmailMessage
+from email.utils import formataddr
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import time
+import random
+import asyncio
+import threading
+from functools import lru_cache, partial
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Google API imports
-from google.auth.transport.requests import Request
+from google.auth.transport.requests import Request, AuthorizedSession
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+# Optional async HTTP client for concurrent sends
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Optional C-based HTML parser for HTML-to-text conversion
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+except ImportError:
+    SelectolaxParser = None
+
+# Optional shared cache for OAuth tokens across processes
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# Optional Rust-backed JSON serializer for results and API error payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from dotenv import load_dotenv
 load_dotenv()
 
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed"""
+    
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+# Accepts bytes directly, so API error bodies need no decode step
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Precompiled patterns for HTML-to-text conversion
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^<]+?>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def _html_to_text(html: str) -> str:
+    """Convert HTML to plain text"""
+    
+    if SelectolaxParser is not None:
+        tree = SelectolaxParser(html)
+        tree.strip_tags(['script', 'style'])
+        text = tree.text(separator=' ')
+    else:
+        # Remove scripts, styles and HTML tags, then decode all HTML entities
+        text = _SCRIPT_STYLE_RE.sub(' ', html)
+        text = _TAG_RE.sub(' ', text)
+        text = unescape(text)
+    
+    # Clean up whitespace
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+@lru_cache(maxsize=None)
+def _sender_headers(sender_name: str, sender_email: str) -> Tuple:
+    """Parse the sender's From / Reply-To / X-Mailer headers once and reuse them for every message"""
+    
+    headers = (
+        ('From', formataddr((sender_name, sender_email))),
+        # Add custom headers for better deliverability
+        ('Reply-To', sender_email),
+        ('X-Mailer', 'Agentic Cold Email System'),
+    )
+    return tuple(policy.SMTP.header_store_parse(name, value)[1] for name, value in headers)
+
+def _build_raw_message(sender_name: str, 
+                       sender_email: str, 
+                       to_email: str, 
+                       subject: str, 
+                       body: str, 
+                       to_name: str = None,
+                       is_html: bool = False) -> str:
+    """Build a base64url-encoded message for the Gmail API (module-level so worker processes can run it)"""
+    
+    # Create message container (becomes multipart/alternative only when HTML is added)
+    message = EmailMessage(policy=policy.SMTP)
+    
+    # Set headers (pre-parsed sender headers are stored without being parsed again)
+    from_header, reply_to_header, mailer_header = _sender_headers(sender_name, sender_email)
+    message['From'] = from_header
+    message['To'] = formataddr((to_name, to_email)) if to_name else to_email
+    message['Subject'] = subject
+    message['Reply-To'] = reply_to_header
+    message['X-Mailer'] = mailer_header
+    
+    # Create body parts
+    if is_html:
+        # Convert plain text to simple HTML if needed
+        if not body.strip().startswith('<'):
+            html_body = body.replace('\n\n', '</p><p>').replace('\n', '<br>')
+            html_body = f"<html><body><p>{html_body}</p></body></html>"
+        else:
+            html_body = body
+        
+        # Add both plain text and HTML versions
+        message.set_content(_html_to_text(html_body))
+        message.add_alternative(html_body, subtype='html')
+    else:
+        # Plain text only: a single text/plain part with no multipart boundary
+        message.set_content(body)
+    
+    # Encode message (base64 output is pure ASCII, so the UTF-8 decoder is unnecessary)
+    return base64.urlsafe_b64encode(bytes(message)).decode('ascii')
+
+def _try_build_raw_message(*args) -> Tuple[Optional[str], Optional[str]]:
+    """Build a raw message, returning (raw, None) on success or (None, error) on failure"""
+    
+    try:
+        return _build_raw_message(*args), None
+    except Exception as e:
+        return None, str(e)
+
+@lru_cache(maxsize=None)
+def _load_credentials_file(token_file: str, scopes: tuple) -> Credentials:
+    """Load saved Gmail credentials once per process"""
+    return Credentials.from_authorized_user_file(token_file, list(scopes))
+
+class RateLimiter:
+    def __init__(self, per_minute: float, burst: int = 1):
+        """Token bucket rate limiter usable from both threads and asyncio tasks"""
+        self.rate = per_minute / 60
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _reserve(self, tokens: int = 1) -> float:
+        """Take tokens (possibly going into debt) and return how long the caller must wait"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+            return max(0.0, -self.tokens / self.rate)
+    
+    def set_rate(self, per_minute: float):
+        """Change the refill rate, crediting tokens earned at the old rate first"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.rate = per_minute / 60
+    
+    def acquire(self, tokens: int = 1) -> float:
+        """Block until the tokens are available; returns the time waited"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    def charge(self, tokens: int):
+        """Take tokens without waiting; the next acquire pays off any debt"""
+        self._reserve(tokens)
+    
+    async def acquire_async(self, tokens: int = 1) -> float:
+        """Asynchronously wait until the tokens are available; returns the time waited"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+class AdaptiveConcurrency:
+    def __init__(self, limit: int, recovery_seconds: float = 30):
+        """Async concurrency cap that halves when Gmail throttles and slowly grows back"""
+        self.max_limit = limit
+        self.limit = limit
+        self.recovery_seconds = recovery_seconds
+        self.in_flight = 0
+        self.last_change = time.monotonic()
+        self._condition = asyncio.Condition()
+    
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify(max(1, self.limit - self.in_flight))
+    
+    def throttled(self):
+        """Halve the cap after a rate limit response"""
+        self.limit = max(1, self.limit // 2)
+        self.last_change = time.monotonic()
+    
+    def succeeded(self):
+        """Raise the cap by one for every quiet recovery period"""
+        now = time.monotonic()
+        if self.limit < self.max_limit and now - self.last_change >= self.recovery_seconds:
+            self.limit += 1
+            self.last_change = now
+
+class ResultsWriter:
+    FIELDNAMES = ['success', 'status', 'recipient', 'recipient_name', 'subject',
+                  'message_id', 'error', 'sent_at', 'failed_at']
+    
+    def __init__(self, results_dir: str, timestamp: str):
+        """Stream per-email send results to CSV and NDJSON while keeping only counters in memory"""
+        os.makedirs(results_dir, exist_ok=True)
+        self.results_file = os.path.join(results_dir, f"sending_results_{timestamp}.csv")
+        self.ndjson_file = os.path.join(results_dir, f"sending_results_{timestamp}.ndjson")
+        
+        self._csv_handle = open(self.results_file, 'w', newline='', encoding='utf-8')
+        self._ndjson_handle = open(self.ndjson_file, 'wb')
+        self._writer = csv.DictWriter(self._csv_handle, fieldnames=self.FIELDNAMES, extrasaction='ignore')
+        self._writer.writeheader()
+        
+        self.total = 0
+        self.successful = 0
+    
+    def write(self, result: Dict):
+        """Append one result to both files and update the counters"""
+        result = self._drop_ns_times(result)
+        
+        self._writer.writerow(result)
+        self._ndjson_handle.write(_json_dumps(result) + b'\n')
+        
+        # Flush so an interrupted campaign still leaves a complete record on disk
+        self._csv_handle.flush()
+        self._ndjson_handle.flush()
+        
+        self.total += 1
+        if result.get('success'):
+            self.successful += 1
+    
+    @staticmethod
+    def _drop_ns_times(result: Dict) -> Dict:
+        """Keep only the ISO timestamps of a result, so the files keep their original shape"""
+        return {key: value for key, value in result.items() if not key.endswith('_at_ns')}
+    
+    def close(self):
+        self._csv_handle.close()
+        self._ndjson_handle.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
 class GmailEmailSender:
     def __init__(self):
         """Initialize Gmail API email sender"""
@@ -32,6 +285,11 @@ class GmailEmailSender:
         # Gmail API scopes
         self.SCOPES = ['https://www.googleapis.com/auth/gmail.send']
         
+        # Optional Redis cache for the OAuth token (set REDIS_URL to enable)
+        self.token_cache_key = 'agentic-coldemail:gmail_token'
+        self.token_cache_ttl = 3300  # seconds, just under the 1 hour access token lifetime
+        self.token_cache = self._connect_token_cache()
+        
         # Initialize Gmail service
         self.service = self._authenticate_gmail()
         
@@ -39,13 +297,46 @@ class GmailEmailSender:
         self.sender_name = os.getenv('SENDER_NAME', 'Your Name')
         self.sender_email = os.getenv('SENDER_EMAIL', 'your.email@gmail.com')
         
-        # Email tracking
-        self.sent_emails = []
-        self.failed_emails = []
+        # Email tracking: running totals plus only the most recent details
+        # (full per-email results are streamed to disk by ResultsWriter)
+        self.send_stats = Counter()
+        self.recent_results_size = 100
+        self.sent_emails = deque(maxlen=self.recent_results_size)
+        self.failed_emails = deque(maxlen=self.recent_results_size)
+        
+        # Rate limiting settings (assigning emails_per_minute retunes the limiter)
+        self.rate_limiter = RateLimiter(5)  # Conservative limit
+        
+        # Columns read from generated email CSVs
+        self.email_csv_columns = ['email', 'subject', 'body', 'name', 'company']
+        
+        # Gmail accepts at most 100 sub-requests per batch HTTP request
+        self.batch_size = 100
+        
+        # Campaigns at least this large build their messages in a process pool
+        self.process_pool_threshold = 200
+        
+        # Synchronous sends build upcoming messages in worker threads, this many ahead
+        self.build_workers = min(4, os.cpu_count() or 1)
+        self.build_queue_size = 32
         
-        # Rate limiting settings
-        self.emails_per_minute = 5  # Conservative limit
-        self.delay_between_emails = 12  # seconds (60/5 = 12)
+        # Maximum in-flight requests for async bulk sending
+        self.max_concurrent_sends = 10
+        
+        # Retries with exponential backoff when Gmail answers 429 / rateLimitExceeded
+        self.max_send_attempts = 5
+        
+        # REST endpoint used by the pooled session and async sends
+        self.gmail_send_url = 'https://gmail.googleapis.com/gmail/v1/users/me/messages/send'
+    
+    @property
+    def emails_per_minute(self) -> float:
+        """Sending rate enforced by the shared rate limiter"""
+        return self.rate_limiter.rate * 60
+    
+    @emails_per_minute.setter
+    def emails_per_minute(self, value: float):
+        self.rate_limiter.set_rate(value)
         
     def _authenticate_gmail(self):
         """Authenticate and return Gmail service object"""
@@ -54,9 +345,10 @@ class GmailEmailSender:
         token_file = 'gmail_token.json'
         credentials_file = 'gmail_credentials.json'
         
-        # Check if we have saved credentials
-        if os.path.exists(token_file):
-            creds = Credentials.from_authorized_user_file(token_file, self.SCOPES)
+        # Check if we have cached or saved credentials
+        creds = self._get_cached_token()
+        if not creds and os.path.exists(token_file):
+            creds = _load_credentials_file(token_file, tuple(self.SCOPES))
         
         # If there are no (valid) credentials available, let the user log in
         if not creds or not creds.valid:
@@ -80,15 +372,64 @@ class GmailEmailSender:
             # Save the credentials for the next run
             with open(token_file, 'w') as token:
                 token.write(creds.to_json())
+            _load_credentials_file.cache_clear()
+            
+            self._set_cached_token(creds)
+        
+        # Keep credentials around for direct (non-discovery) API calls
+        self.creds = creds
+        
+        # Keep-alive session for single sends; refreshes the token on its own when it expires
+        self.session = AuthorizedSession(creds)
         
         try:
-            service = build('gmail', 'v1', credentials=creds)
+            # The bundled discovery document; no network round trip at startup
+            service = build('gmail', 'v1', credentials=creds, static_discovery=True)
             self.logger.info("✅ Gmail API authenticated successfully")
             return service
         except Exception as e:
             self.logger.error(f"❌ Failed to build Gmail service: {str(e)}")
             raise
     
+    def _connect_token_cache(self):
+        """Connect to the Redis token cache if REDIS_URL is set and redis is installed"""
+        
+        redis_url = os.getenv('REDIS_URL')
+        if not redis_url or redis is None:
+            return None
+            
+        try:
+            return redis.Redis.from_url(redis_url)
+        except Exception as e:
+            self.logger.warning(f"Token cache unavailable: {str(e)}")
+            return None
+    
+    def _get_cached_token(self) -> Optional[Credentials]:
+        """Return still-valid credentials from the token cache, if any"""
+        
+        if self.token_cache is None:
+            return None
+            
+        try:
+            cached = self.token_cache.get(self.token_cache_key)
+            if cached:
+                return Credentials.from_authorized_user_info(json.loads(cached), self.SCOPES)
+        except Exception as e:
+            self.logger.warning(f"Could not read cached token: {str(e)}")
+            
+        return None
+    
+    def _set_cached_token(self, creds: Credentials):
+        """Store freshly issued credentials in the token cache"""
+        
+        if self.token_cache is None:
+            return
+            
+        try:
+            self.token_cache.setex(self.token_cache_key, self.token_cache_ttl, creds.to_json())
+        except Exception as e:
+            self.logger.warning(f"Could not cache token: {str(e)}")
+    
     def create_email_message(self, 
                            to_email: str, 
                            subject: str, 
@@ -98,48 +439,16 @@ class GmailEmailSender:
         """Create an email message"""
         
         try:
-            # Create message container
-            message = MIMEMultipart('alternative')
-            
-            # Set headers
-            message['From'] = f"{self.sender_name} <{self.sender_email}>"
-            message['To'] = f"{to_name} <{to_email}>" if to_name else to_email
-            message['Subject'] = subject
-            
-            # Add custom headers for better deliverability
-            message['Reply-To'] = self.sender_email
-            message['X-Mailer'] = 'Agentic Cold Email System'
-            
-            # Create body parts
-            if is_html:
-                # Convert plain text to simple HTML if needed
-                if not body.strip().startswith('<'):
-                    html_body = body.replace('\n\n', '</p><p>').replace('\n', '<br>')
-                    html_body = f"<html><body><p>{html_body}</p></body></html>"
-                else:
-                    html_body = body
-                
-                # Add both plain text and HTML versions
-                text_part = MIMEText(self._html_to_text(html_body), 'plain')
-                html_part = MIMEText(html_body, 'html')
-                
-                message.attach(text_part)
-                message.attach(html_part)
-            else:
-                # Plain text only
-                text_part = MIMEText(body, 'plain')
-                message.attach(text_part)
-            
-            # Encode message
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
+            raw_message = _build_raw_message(
+                self.sender_name, self.sender_email, to_email, subject, body, to_name, is_html
+            )
             
             return {
-                'raw': raw_message,
-                'message_obj': message
+                'raw': raw_message
             }
             
         except Exception as e:
-            self.logger.error(f"Error creating email message: {str(e)}")
+            self.logger.error("Error creating email message: %s", e)
             raise
     
     def send_single_email(self, 
@@ -147,170 +456,542 @@ class GmailEmailSender:
                          subject: str, 
                          body: str, 
                          to_name: str = None,
-                         dry_run: bool = False) -> Dict:
-        """Send a single email"""
+                         dry_run: bool = False,
+                         prebuilt: Tuple[Optional[str], Optional[str]] = (None, None)) -> Dict:
+        """Send a single email, optionally with a prebuilt raw message"""
         
-        try:
-            # Create the email message
-            email_data = self.create_email_message(to_email, subject, body, to_name)
-            
-            if dry_run:
-                self.logger.info(f"🧪 DRY RUN - Would send email to {to_email}")
-                return {
-                    'success': True,
-                    'message_id': 'dry_run_id',
-                    'recipient': to_email,
-                    'subject': subject,
-                    'status': 'dry_run'
-                }
-            
-            # Send the email
-            sent_message = self.service.users().messages().send(
-                userId='me',
-                body={'raw': email_data['raw']}
-            ).execute()
-            
-            message_id = sent_message.get('id')
-            
-            self.logger.info(f"✅ Email sent successfully to {to_email} (ID: {message_id})")
-            
-            # Track sent email
-            sent_info = {
+        # Dry runs never reach the API, so skip building the message entirely
+        if dry_run:
+            self.logger.info("DRY RUN - would send email to %s", to_email)
+            return {
                 'success': True,
-                'message_id': message_id,
+                'message_id': 'dry_run_id',
                 'recipient': to_email,
-                'recipient_name': to_name,
                 'subject': subject,
-                'sent_at': datetime.now().isoformat(),
-                'status': 'sent'
+                'status': 'dry_run'
             }
+        
+        raw_message, build_error = prebuilt
+        if build_error:
+            self.logger.error("Error creating email message for %s: %s", to_email, build_error)
+            return self._record_failure(to_email, to_name, subject, build_error)
+        
+        try:
+            # Create the email message
+            if raw_message is None:
+                raw_message = self.create_email_message(to_email, subject, body, to_name)['raw']
             
-            self.sent_emails.append(sent_info)
-            return sent_info
+            # Send the email over the pooled session, backing off while Gmail reports rate limiting
+            for attempt in range(self.max_send_attempts):
+                response = self.session.post(
+                    self.gmail_send_url,
+                    json={'raw': raw_message},
+                    timeout=30
+                )
+                
+                if (attempt + 1 == self.max_send_attempts 
+                        or not self._is_rate_limit_error(response.status_code, response.content)):
+                    break
+                time.sleep(self._backoff_delay(attempt, to_email))
             
-        except HttpError as e:
-            error_details = json.loads(e.content.decode('utf-8'))
-            error_message = error_details.get('error', {}).get('message', str(e))
+            if not response.ok:
+                error_message = self._response_error_message(response)
+                
+                self.logger.error("Gmail API error sending to %s: %s", to_email, error_message)
+                
+                return self._record_failure(to_email, to_name, subject, error_message)
             
-            self.logger.error(f"❌ Gmail API error sending to {to_email}: {error_message}")
+            message_id = response.json().get('id')
             
-            failed_info = {
-                'success': False,
-                'recipient': to_email,
-                'recipient_name': to_name,
-                'subject': subject,
-                'error': error_message,
-                'failed_at': datetime.now().isoformat(),
-                'status': 'failed'
-            }
+            self.logger.info("Email sent to %s (ID: %s)", to_email, message_id)
             
-            self.failed_emails.append(failed_info)
-            return failed_info
+            return self._record_sent(to_email, to_name, subject, message_id)
             
         except Exception as e:
-            self.logger.error(f"❌ Unexpected error sending to {to_email}: {str(e)}")
+            self.logger.error("Unexpected error sending to %s: %s", to_email, e)
             
-            failed_info = {
-                'success': False,
-                'recipient': to_email,
-                'recipient_name': to_name,
-                'subject': subject,
-                'error': str(e),
-                'failed_at': datetime.now().isoformat(),
-                'status': 'failed'
-            }
+            return self._record_failure(to_email, to_name, subject, str(e))
+    
+    def _is_rate_limit_error(self, status: int, content) -> bool:
+        """Check whether a Gmail API error response means we are being throttled"""
+        
+        if status == 429:
+            return True
+        if status != 403:
+            return False
             
-            self.failed_emails.append(failed_info)
-            return failed_info
+        if isinstance(content, bytes):
+            content = content.decode('utf-8', 'replace')
+        return 'rateLimitExceeded' in content or 'userRateLimitExceeded' in content
+    
+    def _backoff_delay(self, attempt: int, to_email: str) -> float:
+        """Exponential backoff with jitter for a rate-limited send"""
+        
+        delay = 2 ** attempt + random.random()
+        self.logger.warning("Rate limited sending to %s, retrying in %.1f seconds", to_email, delay)
+        return delay
+    
+    def _response_error_message(self, response) -> str:
+        """Extract the human-readable message from a Gmail REST error response"""
+        
+        try:
+            return response.json().get('error', {}).get('message', response.text)
+        except ValueError:
+            return response.text
+    
+    def _http_error_message(self, error: HttpError) -> str:
+        """Extract the human-readable message from a Gmail API error"""
+        
+        try:
+            error_details = _json_loads(error.content)
+            return error_details.get('error', {}).get('message', str(error))
+        except (ValueError, AttributeError):
+            return str(error)
+    
+    def _record_sent(self, to_email: str, to_name: str, subject: str, message_id: str) -> Dict:
+        """Track a successfully sent email"""
+        
+        now_ns = time.time_ns()
+        sent_info = {
+            'success': True,
+            'message_id': message_id,
+            'recipient': to_email,
+            'recipient_name': to_name,
+            'subject': subject,
+            'sent_at': datetime.fromtimestamp(now_ns / 1e9).isoformat(),
+            'sent_at_ns': now_ns,
+            'status': 'sent'
+        }
+        
+        self.send_stats['sent'] += 1
+        self.sent_emails.append(sent_info)
+        return sent_info
+    
+    def _record_failure(self, to_email: str, to_name: str, subject: str, error_message: str) -> Dict:
+        """Track an email that failed to send"""
+        
+        now_ns = time.time_ns()
+        failed_info = {
+            'success': False,
+            'recipient': to_email,
+            'recipient_name': to_name,
+            'subject': subject,
+            'error': error_message,
+            'failed_at': datetime.fromtimestamp(now_ns / 1e9).isoformat(),
+            'failed_at_ns': now_ns,
+            'status': 'failed'
+        }
+        
+        self.send_stats['failed'] += 1
+        self.failed_emails.append(failed_info)
+        return failed_info
     
     def send_bulk_emails(self, 
                         emails_csv: str, 
                         dry_run: bool = True,
                         max_emails: int = None,
-                        start_from: int = 0) -> Dict:
-        """Send bulk emails from CSV file"""
+                        start_from: int = 0,
+                        use_batch: bool = False) -> Dict:
+        """Send bulk emails from CSV file, optionally packing them into Gmail batch requests"""
         
         try:
-            # Read emails from CSV
-            df = pd.read_csv(emails_csv)
-            self.logger.info(f"📧 Loaded {len(df)} emails from {emails_csv}")
-            
-            # Apply limits
-            if start_from > 0:
-                df = df.iloc[start_from:]
-                self.logger.info(f"⏭️ Starting from email {start_from + 1}")
-            
-            if max_emails:
-                df = df.head(max_emails)
-                self.logger.info(f"📊 Limiting to {max_emails} emails")
-            
-            # Check required columns
-            required_columns = ['email', 'subject', 'body']
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            
-            if missing_columns:
-                raise ValueError(f"Missing required columns: {missing_columns}")
+            df = self._load_emails_csv(emails_csv, max_emails, start_from)
             
             # Send emails with rate limiting
-            results = []
             total_emails = len(df)
             
             self.logger.info(f"🚀 Starting to send {total_emails} emails...")
             if dry_run:
                 self.logger.info("🧪 DRY RUN MODE - No emails will actually be sent")
             
-            for index, row in df.iterrows():
-                email_num = index + 1
-                
-                self.logger.info(f"📤 Sending email {email_num}/{total_emails} to {row.get('company', 'Unknown')}")
-                
-                # Send email
-                result = self.send_single_email(
-                    to_email=row['email'],
-                    subject=row['subject'],
-                    body=row['body'],
-                    to_name=row.get('name', ''),
-                    dry_run=dry_run
-                )
+            with self._open_results_writer() as results:
+                self._send_bulk_rows(df, results, dry_run, use_batch)
+            
+            return self._finish_bulk_send(results, dry_run, emails_csv)
+            
+        except Exception as e:
+            self.logger.error(f"❌ Error in bulk email sending: {str(e)}")
+            raise
+    
+    def _send_bulk_rows(self, df: pd.DataFrame, results: ResultsWriter, dry_run: bool, use_batch: bool):
+        """Send every row of the campaign, streaming each result to disk"""
+        
+        total_emails = len(df)
+        logger = self.logger
+        
+        if use_batch and not dry_run:
+            # Batch mode trades per-email pacing for fewer round trips: at most a minute's
+            # worth of emails per batch, with the limiter spacing the batches out
+            batch_size = max(1, min(self.batch_size, int(self.emails_per_minute)))
+            
+            for start in range(0, total_emails, batch_size):
+                chunk = df.iloc[start:start + batch_size]
                 
-                results.append(result)
+                # Wait for one slot now and charge the rest after sending, so the first
+                # batch goes out immediately and the next one waits until this one is paid for
+                waited = self.rate_limiter.acquire()
+                if waited:
+                    logger.debug("Waited %.1f seconds for the rate limiter", waited)
                 
-                # Rate limiting (skip on last email)
-                if email_num < total_emails:
-                    self.logger.info(f"⏳ Waiting {self.delay_between_emails} seconds before next email...")
-                    time.sleep(self.delay_between_emails)
+                logger.info("Sending batch of %d emails (%d/%d)", len(chunk), start + len(chunk), total_emails)
+                for result in self._send_batch(chunk):
+                    results.write(result)
                 
-                # Progress update every 5 emails
-                if email_num % 5 == 0:
-                    successful = sum(1 for r in results if r.get('success'))
-                    self.logger.info(f"📊 Progress: {email_num}/{total_emails} processed, {successful} successful")
-            
-            # Generate summary
-            successful_sends = [r for r in results if r.get('success')]
-            failed_sends = [r for r in results if not r.get('success')]
-            
-            summary = {
-                'total_processed': total_emails,
-                'successful_sends': len(successful_sends),
-                'failed_sends': len(failed_sends),
-                'success_rate': len(successful_sends) / total_emails * 100 if total_emails > 0 else 0,
-                'dry_run': dry_run,
-                'results': results,
-                'processed_at': datetime.now().isoformat()
-            }
+                self.rate_limiter.charge(len(chunk) - 1)
+            
+            return
+        
+        # Worker threads build upcoming messages while this thread waits on the network
+        if dry_run:
+            rows = ((row, (None, None)) for row in df.itertuples(index=False))
+        else:
+            rows = self._iter_prebuilt_messages(df)
+        
+        for email_num, (row, prebuilt) in enumerate(rows, 1):
+            # Rate limiting (dry runs never reach the API)
+            if not dry_run:
+                waited = self.rate_limiter.acquire()
+                if waited:
+                    logger.debug("Waited %.1f seconds for the rate limiter", waited)
             
-            # Save results
-            self._save_sending_results(summary, emails_csv)
+            logger.info("Sending email %d/%d to %s", email_num, total_emails, row.company or 'Unknown')
             
-            self.logger.info(f"✅ Bulk email sending completed!")
-            self.logger.info(f"📊 Summary: {len(successful_sends)}/{total_emails} sent successfully ({summary['success_rate']:.1f}%)")
+            # Send email
+            result = self.send_single_email(
+                to_email=row.email,
+                subject=row.subject,
+                body=row.body,
+                to_name=row.name,
+                dry_run=dry_run,
+                prebuilt=prebuilt
+            )
             
-            return summary
+            results.write(result)
+            
+            # Progress update every 5 emails
+            if email_num % 5 == 0:
+                logger.info("Progress: %d/%d processed, %d successful", email_num, total_emails, results.successful)
+    
+    def _send_batch(self, chunk: pd.DataFrame) -> List[Dict]:
+        """Send up to 100 emails in a single Gmail batch HTTP request"""
+        
+        rows = list(chunk.itertuples(index=False))
+        results = [None] * len(rows)
+        logger = self.logger
+        
+        throttled = []
+        
+        def on_response(request_id, response, exception):
+            i = int(request_id)
+            row = rows[i]
+            to_name = row.name
+            
+            if exception is not None:
+                if isinstance(exception, HttpError):
+                    # Rate-limited requests go into the next retry batch while attempts remain
+                    if retries_left and self._is_rate_limit_error(exception.resp.status, exception.content):
+                        throttled.append(i)
+                        return
+                    error_message = self._http_error_message(exception)
+                else:
+                    error_message = str(exception)
+                logger.error("Gmail API error sending to %s: %s", row.email, error_message)
+                results[i] = self._record_failure(row.email, to_name, row.subject, error_message)
+            else:
+                message_id = response.get('id')
+                logger.info("Email sent to %s (ID: %s)", row.email, message_id)
+                results[i] = self._record_sent(row.email, to_name, row.subject, message_id)
+        
+        raw_messages = {}
+        for i, row in enumerate(rows):
+            try:
+                raw_messages[i] = self.create_email_message(row.email, row.subject, row.body, row.name)['raw']
+            except Exception as e:
+                results[i] = self._record_failure(row.email, row.name, row.subject, str(e))
+        
+        pending = list(raw_messages)
+        batch_error = "Gmail batch request failed"
+        for attempt in range(self.max_send_attempts):
+            retries_left = attempt + 1 < self.max_send_attempts
+            throttled.clear()
+            
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for i in pending:
+                batch.add(
+                    self.service.users().messages().send(userId='me', body={'raw': raw_messages[i]}),
+                    request_id=str(i)
+                )
+            
+            try:
+                batch.execute()
+            except Exception as e:
+                self.logger.error(f"❌ Gmail batch request failed: {str(e)}")
+                batch_error = str(e)
+                break
+            
+            if not throttled:
+                break
+            
+            time.sleep(self._backoff_delay(attempt, f"{len(throttled)} batched recipients"))
+            pending = list(throttled)
+        
+        # Anything still unanswered failed along with its batch request
+        for i, row in enumerate(rows):
+            if results[i] is None:
+                results[i] = self._record_failure(row.email, row.name, row.subject, batch_error)
+        
+        return results
+    
+    async def send_bulk_emails_async(self, 
+                                    emails_csv: str, 
+                                    dry_run: bool = True,
+                                    max_emails: int = None,
+                                    start_from: int = 0) -> Dict:
+        """Send bulk emails from CSV file with concurrent Gmail API requests"""
+        
+        if httpx is None:
+            raise ImportError("send_bulk_emails_async requires httpx: pip install httpx")
+        
+        try:
+            df = self._load_emails_csv(emails_csv, max_emails, start_from)
+            total_emails = len(df)
+            
+            self.logger.info(f"🚀 Starting to send {total_emails} emails concurrently...")
+            if dry_run:
+                self.logger.info("🧪 DRY RUN MODE - No emails will actually be sent")
+            elif not self.creds.valid:
+                self.creds.refresh(Request())
+            
+            # Sends that find the token expired refresh it once between them
+            self._token_lock = asyncio.Lock()
+            
+            # Finish the CPU-bound message building before the network stage starts
+            built_messages = [(None, None)] * total_emails if dry_run else self._prebuild_raw_messages(df)
+            
+            # Requests overlap on the network; the rate limiter still spaces out sends
+            concurrency = AdaptiveConcurrency(self.max_concurrent_sends)
+            
+            async with self._build_async_client() as client:
+                sends = [
+                    self._send_email_async(
+                        client,
+                        concurrency,
+                        to_email=row.email,
+                        subject=row.subject,
+                        body=row.body,
+                        to_name=row.name,
+                        dry_run=dry_run,
+                        prebuilt=built
+                    )
+                    for row, built in zip(df.itertuples(index=False), built_messages)
+                ]
+                
+                # Write each result as soon as its send finishes
+                with self._open_results_writer() as results:
+                    for send in asyncio.as_completed(sends):
+                        results.write(await send)
+            
+            return self._finish_bulk_send(results, dry_run, emails_csv)
             
         except Exception as e:
-            self.logger.error(f"❌ Error in bulk email sending: {str(e)}")
+            self.logger.error(f"❌ Error in async bulk email sending: {str(e)}")
             raise
     
+    def _build_async_client(self):
+        """Create the async Gmail client, multiplexing sends over HTTP/2 when h2 is installed"""
+        
+        limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+        try:
+            return httpx.AsyncClient(http2=True, limits=limits, timeout=30)
+        except ImportError:
+            # HTTP/2 support needs the optional h2 package
+            return httpx.AsyncClient(limits=limits, timeout=30)
+    
+    async def _send_email_async(self, 
+                                client, 
+                                concurrency: AdaptiveConcurrency, 
+                                to_email: str, 
+                                subject: str, 
+                                body: str, 
+                                to_name: str = None,
+                                dry_run: bool = False,
+                                prebuilt: Tuple[Optional[str], Optional[str]] = (None, None)) -> Dict:
+        """Send a single email through the Gmail REST endpoint, optionally with a prebuilt raw message"""
+        
+        if dry_run:
+            return self.send_single_email(to_email, subject, body, to_name, dry_run=True)
+        
+        raw_message, build_error = prebuilt
+        if build_error:
+            self.logger.error("Error creating email message for %s: %s", to_email, build_error)
+            return self._record_failure(to_email, to_name, subject, build_error)
+        
+        await self.rate_limiter.acquire_async()
+        
+        async with concurrency:
+            try:
+                if raw_message is None:
+                    raw_message = self.create_email_message(to_email, subject, body, to_name)['raw']
+                
+                # Retry throttled sends with backoff, shrinking the concurrency cap each time
+                token_refreshed = False
+                for attempt in range(self.max_send_attempts):
+                    if not self.creds.valid:
+                        await self._refresh_token_async(self.creds.token)
+                    
+                    token = self.creds.token
+                    response = await client.post(
+                        self.gmail_send_url,
+                        json={'raw': raw_message},
+                        headers={'Authorization': f"Bearer {token}"}
+                    )
+                    
+                    # The token can still be revoked or expire early; refresh it once and resend
+                    if (response.status_code == 401 and not token_refreshed 
+                            and attempt + 1 < self.max_send_attempts):
+                        token_refreshed = True
+                        await self._refresh_token_async(token)
+                        continue
+                    
+                    if (attempt + 1 == self.max_send_attempts 
+                            or not self._is_rate_limit_error(response.status_code, response.content)):
+                        break
+                    
+                    concurrency.throttled()
+                    await asyncio.sleep(self._backoff_delay(attempt, to_email))
+                
+                if response.is_error:
+                    error_message = self._response_error_message(response)
+                    
+                    self.logger.error("Gmail API error sending to %s: %s", to_email, error_message)
+                    return self._record_failure(to_email, to_name, subject, error_message)
+                
+                concurrency.succeeded()
+                message_id = response.json().get('id')
+                
+                self.logger.info("Email sent to %s (ID: %s)", to_email, message_id)
+                
+                return self._record_sent(to_email, to_name, subject, message_id)
+                
+            except Exception as e:
+                self.logger.error("Unexpected error sending to %s: %s", to_email, e)
+                
+                return self._record_failure(to_email, to_name, subject, str(e))
+    
+    async def _refresh_token_async(self, stale_token: Optional[str]):
+        """Refresh the OAuth token off the event loop, unless another send already replaced it"""
+        
+        async with self._token_lock:
+            if self.creds.token == stale_token:
+                await asyncio.to_thread(self.creds.refresh, Request())
+                self.logger.info("🔄 Refreshed Gmail access token")
+    
+    def _iter_prebuilt_messages(self, df: pd.DataFrame):
+        """Yield (row, (raw, error)) in order, building up to build_queue_size messages ahead in threads"""
+        
+        build = partial(_try_build_raw_message, self.sender_name, self.sender_email)
+        pending = deque()
+        
+        with ThreadPoolExecutor(max_workers=self.build_workers) as executor:
+            for row in df.itertuples(index=False):
+                pending.append((row, executor.submit(build, row.email, row.subject, row.body, row.name)))
+                
+                # Bounded look-ahead keeps memory flat on large campaigns
+                if len(pending) >= self.build_queue_size:
+                    next_row, future = pending.popleft()
+                    yield next_row, future.result()
+            
+            while pending:
+                next_row, future = pending.popleft()
+                yield next_row, future.result()
+    
+    def _prebuild_raw_messages(self, df: pd.DataFrame) -> List[Tuple[Optional[str], Optional[str]]]:
+        """Build every raw message up front, spreading large campaigns across CPU cores"""
+        
+        build = partial(_try_build_raw_message, self.sender_name, self.sender_email)
+        columns = (df['email'], df['subject'], df['body'], df['name'])
+        
+        # Worker startup costs more than building a small campaign serially
+        if len(df) < self.process_pool_threshold:
+            return list(map(build, *columns))
+            
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(build, *columns, chunksize=64))
+    
+    def _load_emails_csv(self, emails_csv: str, max_emails: int = None, start_from: int = 0) -> pd.DataFrame:
+        """Load and validate the emails to send from a CSV file"""
+        
+        # Read only the needed columns and rows, as plain strings
+        df = pd.read_csv(
+            emails_csv,
+            usecols=lambda column: column in self.email_csv_columns,
+            dtype=str,
+            keep_default_na=False,
+            skiprows=range(1, start_from + 1) if start_from > 0 else None,
+            nrows=max_emails or None,
+            engine='c'
+        )
+        self.logger.info(f"📧 Loaded {len(df)} emails from {emails_csv}")
+        
+        if start_from > 0:
+            self.logger.info(f"⏭️ Starting from email {start_from + 1}")
+        
+        if max_emails:
+            self.logger.info(f"📊 Limiting to {max_emails} emails")
+        
+        # Check required columns
+        required_columns = ['email', 'subject', 'body']
+        missing_columns = set(required_columns).difference(df.columns)
+        
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {sorted(missing_columns)}")
+        
+        # Drop rows with an empty required field up front instead of failing mid-campaign
+        # (empty cells load as '' because NA parsing is disabled)
+        complete_rows = (df[required_columns] != '').all(axis=1)
+        if not complete_rows.all():
+            self.logger.warning(f"⚠️ Skipping {int((~complete_rows).sum())} rows with empty email, subject or body")
+            df = df[complete_rows].reset_index(drop=True)
+        
+        # Optional columns default to empty so rows can be read as plain tuples
+        for column in self.email_csv_columns:
+            if column not in df.columns:
+                df[column] = ''
+        
+        return df
+    
+    def _open_results_writer(self) -> ResultsWriter:
+        """Open the streaming results files for a bulk send"""
+        
+        self.results_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return ResultsWriter("data/email_results", self.results_timestamp)
+    
+    def _finish_bulk_send(self, results: ResultsWriter, dry_run: bool, emails_csv: str) -> Dict:
+        """Summarize and save the results of a bulk send"""
+        
+        total_emails = results.total
+        successful_sends = results.successful
+        
+        # Generate summary (per-email results were already streamed to disk)
+        summary = {
+            'total_processed': total_emails,
+            'successful_sends': successful_sends,
+            'failed_sends': total_emails - successful_sends,
+            'success_rate': successful_sends / total_emails * 100 if total_emails > 0 else 0,
+            'dry_run': dry_run,
+            'results_file': results.results_file,
+            'results_ndjson': results.ndjson_file,
+            'processed_at': datetime.now().isoformat()
+        }
+        
+        # Save results
+        self._save_sending_results(summary, emails_csv)
+        
+        self.logger.info(f"✅ Bulk email sending completed!")
+        self.logger.info(f"📊 Summary: {successful_sends}/{total_emails} sent successfully ({summary['success_rate']:.1f}%)")
+        
+        return summary
+    
     def send_generated_emails(self, 
                             emails_csv: str = None,
                             dry_run: bool = True,
@@ -335,74 +1016,39 @@ class GmailEmailSender:
     def _find_latest_generated_emails(self) -> str:
         """Find the latest generated emails CSV file"""
         
-        data_dir = "data"
-        if not os.path.exists(data_dir):
-            return None
-        
-        # Look for internship emails files
-        email_files = [
-            f for f in os.listdir(data_dir) 
-            if f.startswith('internship_emails_') and f.endswith('.csv')
-        ]
-        
-        if not email_files:
-            return None
-        
-        # Return the most recent file
-        latest_file = sorted(email_files)[-1]
-        return os.path.join(data_dir, latest_file)
+        # Single pass over matching files; newest by modification time
+        pattern = os.path.join("data", "internship_emails_*.csv")
+        return max(glob.iglob(pattern), key=os.path.getmtime, default=None)
     
     def _save_sending_results(self, summary: Dict, source_csv: str):
-        """Save email sending results"""
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        """Save email sending summary"""
         
-        # Create results directory
-        os.makedirs("data/email_results", exist_ok=True)
-        
-        # Save summary as JSON
-        summary_file = f"data/email_results/sending_summary_{timestamp}.json"
-        with open(summary_file, 'w') as f:
-            json.dump(summary, f, indent=2)
-        
-        # Save detailed results as CSV
-        results_file = f"data/email_results/sending_results_{timestamp}.csv"
-        df_results = pd.DataFrame(summary['results'])
-        df_results.to_csv(results_file, index=False)
+        # Save summary as JSON next to the streamed results
+        summary_file = f"data/email_results/sending_summary_{self.results_timestamp}.json"
+        with open(summary_file, 'wb') as f:
+            f.write(_json_dumps(summary, indent=True))
         
         self.logger.info(f"📁 Results saved to:")
         self.logger.info(f"   Summary: {summary_file}")
-        self.logger.info(f"   Details: {results_file}")
+        self.logger.info(f"   Details: {summary['results_file']}")
     
     def _html_to_text(self, html: str) -> str:
         """Convert HTML to plain text"""
-        # Simple HTML to text conversion
-        import re
-        
-        # Remove HTML tags
-        text = re.sub('<[^<]+?>', '', html)
-        
-        # Replace HTML entities
-        text = text.replace('&nbsp;', ' ')
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        
-        # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        return _html_to_text(html)
     
     def get_sending_statistics(self) -> Dict:
         """Get statistics about sent emails"""
         
+        total_sent = self.send_stats['sent']
+        total_failed = self.send_stats['failed']
+        
         return {
-            'total_sent': len(self.sent_emails),
-            'total_failed': len(self.failed_emails),
-            'success_rate': len(self.sent_emails) / (len(self.sent_emails) + len(self.failed_emails)) * 100 
-                           if (len(self.sent_emails) + len(self.failed_emails)) > 0 else 0,
-            'sent_emails': self.sent_emails,
-            'failed_emails': self.failed_emails
+            'total_sent': total_sent,
+            'total_failed': total_failed,
+            'success_rate': total_sent / (total_sent + total_failed) * 100 
+                           if (total_sent + total_failed) > 0 else 0,
+            'sent_emails': list(self.sent_emails),
+            'failed_emails': list(self.failed_emails)
         }
     
     def test_gmail_connection(self) -> bool:
@@ -1,16 +1,154 @@
 import google.generativeai as genai
+import google.ai.generativelanguage as glm
 import os
+import re
+import csv
 import logging
+import asyncio
+import time
 import json
+import hashlib
 import pandas as pd
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
 from dotenv import load_dotenv
-from datetime import datetime
+from datetime import datetime, timedelta
+
+# Optional persistent store for generated emails between runs
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
 
 load_dotenv()
 
+# Part of the response cache key; bump when the prompt wording changes
+_PROMPT_VERSION = 1
+
+# Static prompt sections, placed before the per-recipient details so every
+# request shares the same prefix (Gemini's prefix cache only matches exact prefixes)
+_PROMPT_HEADER = "Write a professional internship application email.\n"
+
+_PROMPT_STUDENT_TEMPLATE = """
+STUDENT DETAILS:
+- Name: {name}
+- Status: {current_role}
+- Year: {year}
+- Skills: {skills}
+- Graduation: {graduation_year}
+"""
+
+_PROMPT_FORMAT_RULES = """
+Write a 150-200 word email that:
+1. Greets the recipient professionally by name
+2. Introduces the student seeking internship
+3. Mentions specific interest in the recipient's company
+4. Highlights relevant skills and projects
+5. Shows eagerness to learn
+6. Requests opportunity to discuss
+7. Ends professionally
+
+Format the response EXACTLY like this:
+SUBJECT: [Your subject line here]
+
+BODY:
+[Your email body here]
+
+Make it personal, enthusiastic, and professional. Focus on learning opportunity.
+"""
+
+# Company information for better personalization, built once at import
+_COMPANY_INSIGHTS = MappingProxyType({
+    'Paytm': MappingProxyType({
+        'business': 'Digital payments and financial services',
+        'key_products': 'Paytm Wallet, UPI payments, Paytm Mall',
+        'recent_news': 'Leading digital payments platform in India',
+        'culture': 'Innovation-focused, customer-centric'
+    }),
+    'Razorpay': MappingProxyType({
+        'business': 'Payment gateway and financial services',
+        'key_products': 'Payment gateway, RazorpayX, Capital',
+        'recent_news': 'Unicorn status, expanding to Southeast Asia',
+        'culture': 'Developer-first, transparency, growth mindset'
+    }),
+    'PhonePe': MappingProxyType({
+        'business': 'Digital payments and financial services',
+        'key_products': 'UPI payments, Switch platform, insurance',
+        'recent_news': 'Market leader in UPI transactions',
+        'culture': 'Innovation, inclusion, customer obsession'
+    }),
+    'Zerodha': MappingProxyType({
+        'business': 'Online stock brokerage',
+        'key_products': 'Kite trading platform, Coin, Varsity',
+        'recent_news': 'Largest retail broker in India',
+        'culture': 'Bootstrapped, customer-first, tech-driven'
+    }),
+    'CRED': MappingProxyType({
+        'business': 'Credit card management and rewards',
+        'key_products': 'CRED app, CRED Pay, CRED Cash',
+        'recent_news': 'Premium customer base, high engagement',
+        'culture': 'Design-focused, premium experience, trust'
+    }),
+    'BharatPe': MappingProxyType({
+        'business': 'Merchant payments and lending',
+        'key_products': 'QR code payments, POS devices, loans',
+        'recent_news': 'Expanding merchant network rapidly',
+        'culture': 'Merchant-first, aggressive growth, innovation'
+    })
+})
+
+_DEFAULT_COMPANY = MappingProxyType({
+    'business': 'Technology and financial services',
+    'culture': 'Innovation-focused'
+})
+
+_GEMINI_API_ENDPOINT = 'generativelanguage.googleapis.com'
+
+# Fallback email used when generation fails; profile fields are filled in once per writer
+_FALLBACK_EMAIL_TEMPLATE = """Dear {recipient_name},
+
+I hope this email finds you well. I am {name}, a {year} {education} student, writing to express my strong interest in software internship opportunities at {company_name}.
+
+With {experience} and skills in {skills}, I am eager to gain hands-on industry experience and contribute to {company_name}'s innovative projects in the fintech space.
+
+I am particularly excited about the opportunity to learn from your team and contribute to your mission while developing my technical skills in a real-world environment.
+
+I would be grateful for the opportunity to discuss how my academic background and passion for technology align with your internship programs.
+
+Thank you for your time and consideration. I look forward to hearing from you.
+
+Best regards,
+{name}
+{current_role}
+Expected Graduation: {graduation_year}"""
+
+# The prompt asks for 150-200 words (~300 tokens); the cap stops runaway generations
+_MAX_EMAIL_TOKENS = 400
+_GEN_CONFIG = genai.types.GenerationConfig(
+    candidate_count=1,
+    max_output_tokens=_MAX_EMAIL_TOKENS,
+    temperature=0.7,
+    top_p=0.95
+)
+
+# "SUBJECT: ..." on its own line, then everything after a later "BODY:" marker
+_EMAIL_RESPONSE_RE = re.compile(
+    r'^[ \t]*SUBJECT:[ \t]*(?P<subject>[^\n]*)\n.*?^[ \t]*BODY:(?P<body>.*)',
+    re.MULTILINE | re.DOTALL | re.IGNORECASE
+)
+_MARKDOWN_EMPHASIS_RE = re.compile(r'\*+')
+_LINE_BREAK_RE = re.compile(r'\s*\n\s*')
+# Salutation line of a generated email, rebuilt per recipient when a cached email is reused
+_GREETING_RE = re.compile(r'(dear|hi|hello)\b[^\n]*', re.IGNORECASE)
+
+# Confidence-score keywords, matched as substrings in one case-insensitive scan each
+_INTERNSHIP_WORDS = frozenset({'intern', 'learning', 'student', 'academic', 'project', 'course'})
+_CALL_TO_ACTION_WORDS = frozenset({'discuss', 'chat', 'connect', 'meeting', 'opportunity'})
+_INTERNSHIP_WORDS_RE = re.compile('|'.join(sorted(_INTERNSHIP_WORDS)), re.IGNORECASE)
+_CALL_TO_ACTION_RE = re.compile('|'.join(sorted(_CALL_TO_ACTION_WORDS)), re.IGNORECASE)
+
 class EmailWriter:
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         """Initialize the EmailWriter with Gemini AI configuration"""
         
         # Set up logging
@@ -22,71 +160,17 @@ class EmailWriter:
         if not api_key:
             raise ValueError("GEMINI_API_KEY not found in environment variables")
             
-        genai.configure(api_key=api_key)
+        # The default transport is already gRPC; bulk runs open their own async client with these options
+        self._client_options = {'api_key': api_key, 'api_endpoint': _GEMINI_API_ENDPOINT}
+        genai.configure(api_key=api_key, client_options={'api_endpoint': _GEMINI_API_ENDPOINT})
         
-        # Initialize the model with updated name
-        try:
-            # Try the new model names first
-            self.model = genai.GenerativeModel('gemini-1.5-flash')
-            self.logger.info("Using gemini-1.5-flash model")
-        except Exception:
-            try:
-                self.model = genai.GenerativeModel('gemini-1.5-pro')
-                self.logger.info("Using gemini-1.5-pro model")
-            except Exception:
-                try:
-                    self.model = genai.GenerativeModel('gemini-pro')
-                    self.logger.info("Using gemini-pro model")
-                except Exception as e:
-                    # List available models and show error
-                    self.logger.error("Failed to initialize any model. Available models:")
-                    try:
-                        for model in genai.list_models():
-                            if 'generateContent' in model.supported_generation_methods:
-                                self.logger.info(f"  - {model.name}")
-                    except Exception:
-                        pass
-                    raise ValueError(f"Could not initialize Gemini model: {str(e)}")
-        
-        # Company information for better personalization
-        self.company_insights = {
-            'Paytm': {
-                'business': 'Digital payments and financial services',
-                'key_products': 'Paytm Wallet, UPI payments, Paytm Mall',
-                'recent_news': 'Leading digital payments platform in India',
-                'culture': 'Innovation-focused, customer-centric'
-            },
-            'Razorpay': {
-                'business': 'Payment gateway and financial services',
-                'key_products': 'Payment gateway, RazorpayX, Capital',
-                'recent_news': 'Unicorn status, expanding to Southeast Asia',
-                'culture': 'Developer-first, transparency, growth mindset'
-            },
-            'PhonePe': {
-                'business': 'Digital payments and financial services',
-                'key_products': 'UPI payments, Switch platform, insurance',
-                'recent_news': 'Market leader in UPI transactions',
-                'culture': 'Innovation, inclusion, customer obsession'
-            },
-            'Zerodha': {
-                'business': 'Online stock brokerage',
-                'key_products': 'Kite trading platform, Coin, Varsity',
-                'recent_news': 'Largest retail broker in India',
-                'culture': 'Bootstrapped, customer-first, tech-driven'
-            },
-            'CRED': {
-                'business': 'Credit card management and rewards',
-                'key_products': 'CRED app, CRED Pay, CRED Cash',
-                'recent_news': 'Premium customer base, high engagement',
-                'culture': 'Design-focused, premium experience, trust'
-            },
-            'BharatPe': {
-                'business': 'Merchant payments and lending',
-                'key_products': 'QR code payments, POS devices, loans',
-                'recent_news': 'Expanding merchant network rapidly',
-                'culture': 'Merchant-first, aggressive growth, innovation'
-            }
-        }
+        # Initialize the model (GenerativeModel does not validate the name, so there is nothing to fall back from)
+        model_name = os.getenv('GEMINI_MODEL', 'gemini-1.5-flash')
+        self.model = genai.GenerativeModel(model_name)
+        self.logger.info(f"Using {model_name} model")
+        
+        # Company information for better personalization (shared, read-only)
+        self.company_insights = _COMPANY_INSIGHTS
         
         # User profile for personalization - UPDATE FOR INTERNSHIP
         self.user_profile = {
@@ -99,6 +183,59 @@ class EmailWriter:
             'achievements': os.getenv('ACHIEVEMENTS', 'Led multiple successful projects'),
             'graduation_year': os.getenv('GRADUATION_YEAR', '2026')
         }
+        
+        # Static prompt prefix, rendered once since the profile does not change
+        self._prompt_prefix = (
+            _PROMPT_HEADER
+            + _PROMPT_STUDENT_TEMPLATE.format_map(self.user_profile)
+            + _PROMPT_FORMAT_RULES
+        )
+        
+        # Generated emails reused per (company, internship type, profile); only the greeting changes
+        self.use_cache = use_cache
+        self._profile_hash = hashlib.sha256(
+            json.dumps(self.user_profile, sort_keys=True).encode('utf-8')
+        ).hexdigest()
+        self._response_cache: Dict[str, Dict] = {}
+        self._disk_cache = self._open_disk_cache() if use_cache else None
+        self.response_cache_ttl = timedelta(days=7)
+        # Cache keys currently being generated, so concurrent duplicates wait instead of calling again
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        
+        # Fallback template with the profile baked in, leaving only the recipient fields
+        # (braces in profile values are escaped so they survive the second format)
+        escaped_profile = {
+            key: value.replace('{', '{{').replace('}', '}}') for key, value in self.user_profile.items()
+        }
+        self._fallback_format = _FALLBACK_EMAIL_TEMPLATE.format_map({
+            **escaped_profile,
+            'recipient_name': '{recipient_name}',
+            'company_name': '{company_name}'
+        }).format
+        # What the parser substitutes for an unusable reply; never cached
+        self._generic_fallback_body = self._fallback_format(recipient_name='Hiring Manager', company_name='your company')
+        
+        # Columns of the generated emails CSV (read back by emailSender)
+        self.generated_email_columns = [
+            'subject', 'body', 'generated_at', 'recipient', 'company', 'email_type',
+            'internship_type', 'confidence_score', 'name', 'title', 'email', 'linkedin_url', 'error'
+        ]
+        
+        # Bulk generation: concurrent Gemini requests, each slot pausing between calls
+        self.max_concurrent_requests = 5
+        self.request_delay = 3  # seconds
+        
+        # Without the response cache, contacts at one company share a call, this many at a time
+        self.company_batch_size = 5
+        
+        # Optional Gemini context cache holding the static prompt prefix (GEMINI_CONTEXT_CACHE=1)
+        self.context_cache_ttl = timedelta(minutes=60)
+        self.cached_model = None
+        self._context_cache_expires = 0.0
+        self._create_context_cache()
+        
+        # Bulk runs open their connection with a one-token request first (EMAIL_WRITER_WARMUP=0 to skip)
+        self.warm_up = os.getenv('EMAIL_WRITER_WARMUP', '1') == '1'
 
     def write_personalized_email(self, 
                                 contact_info: Dict, 
@@ -110,89 +247,402 @@ class EmailWriter:
         """
         
         try:
-            # Get company insights
-            company_data = self.company_insights.get(
-                contact_info.get('company', ''), 
-                {'business': 'Technology and financial services', 'culture': 'Innovation-focused'}
-            )
+            cache_key = self._response_cache_key(contact_info, email_type, internship_type)
+            cached_email = self._get_cached_response(cache_key, contact_info)
+            if cached_email:
+                return self._finish_email(cached_email, contact_info, email_type, internship_type)
             
-            # Create a simplified prompt
-            prompt = self._create_simple_prompt(
-                contact_info=contact_info,
-                email_type=email_type,
-                internship_type=internship_type,
-                company_data=company_data
-            )
+            model, prompt = self._build_email_request(contact_info, email_type, internship_type)
             
             # Generate email using Gemini
-            response = self.model.generate_content(prompt)
-            email_content = response.text
+            response = model.generate_content(prompt, generation_config=_GEN_CONFIG)
             
             # Parse the response to extract subject and body
+            parsed_email = self._parse_email_response(response.text)
+            self._set_cached_response(cache_key, parsed_email, contact_info)
+            
+            return self._finish_email(parsed_email, contact_info, email_type, internship_type)
+            
+        except Exception as e:
+            return self._failed_email(contact_info, email_type, internship_type, e)
+
+    def iter_personalized_email(self, 
+                                contact_info: Dict, 
+                                email_type: str = 'internship_application',
+                                internship_type: str = None) -> Iterator[Tuple[str, str]]:
+        """
+        Stream a personalized internship email, yielding (subject, partial_body) as Gemini
+        writes it; the last tuple yielded is the final parsed email
+        """
+        
+        cache_key = self._response_cache_key(contact_info, email_type, internship_type)
+        cached_email = self._get_cached_response(cache_key, contact_info)
+        if cached_email:
+            yield cached_email['subject'], cached_email['body']
+            return
+        
+        try:
+            model, prompt = self._build_email_request(contact_info, email_type, internship_type)
+            
+            # The subject is usable as soon as the BODY: marker has streamed in
+            email_content = ''
+            for chunk in model.generate_content(prompt, generation_config=_GEN_CONFIG, stream=True):
+                email_content += chunk.text
+                match = _EMAIL_RESPONSE_RE.search(email_content)
+                if match:
+                    subject = _MARKDOWN_EMPHASIS_RE.sub('', match['subject']).strip().strip('"\'')
+                    yield subject, match['body'].strip()
+            
             parsed_email = self._parse_email_response(email_content)
+            self._set_cached_response(cache_key, parsed_email, contact_info)
             
-            # Add metadata
-            parsed_email.update({
-                'generated_at': datetime.now().isoformat(),
-                'recipient': contact_info.get('name', 'Hiring Manager'),
-                'company': contact_info.get('company', 'Company'),
-                'email_type': email_type,
-                'internship_type': internship_type,
-                'confidence_score': self._calculate_confidence_score(parsed_email)
-            })
+        except Exception as e:
+            parsed_email = self._failed_email(contact_info, email_type, internship_type, e)
+        
+        yield parsed_email['subject'], parsed_email['body']
+
+    async def awrite_personalized_email(self, 
+                                        contact_info: Dict, 
+                                        email_type: str = 'internship_application',
+                                        internship_type: str = None,
+                                        additional_context: str = None) -> Dict:
+        """
+        Write a personalized internship email using Gemini AI without blocking the event loop
+        """
+        
+        email_data, _ = await self._awrite_email(contact_info, email_type, internship_type)
+        return email_data
+
+    async def _awrite_email(self, contact_info: Dict, email_type: str, internship_type: str) -> Tuple[Dict, bool]:
+        """awrite_personalized_email, also reporting whether a Gemini request was made"""
+        
+        called_api = False
+        try:
+            cache_key = self._response_cache_key(contact_info, email_type, internship_type)
+            cached_email = self._get_cached_response(cache_key, contact_info)
+            if cached_email:
+                return self._finish_email(cached_email, contact_info, email_type, internship_type), False
             
-            self.logger.info(f"Generated {email_type} email for internship at {contact_info.get('company', 'Unknown Company')}")
+            # The same email is already being generated in this run: reuse it once it is cached
+            pending = self._in_flight.get(cache_key) if self.use_cache else None
+            if pending is not None:
+                await pending
+                cached_email = self._get_cached_response(cache_key, contact_info)
+                if cached_email:
+                    return self._finish_email(cached_email, contact_info, email_type, internship_type), False
             
-            return parsed_email
+            model, prompt = self._build_email_request(contact_info, email_type, internship_type)
+            
+            generation = asyncio.get_running_loop().create_future()
+            if self.use_cache:
+                self._in_flight[cache_key] = generation
+            called_api = True
+            try:
+                # Generate email using Gemini
+                response = await model.generate_content_async(prompt, generation_config=_GEN_CONFIG)
+                
+                # Parse the response to extract subject and body
+                parsed_email = self._parse_email_response(response.text)
+                self._set_cached_response(cache_key, parsed_email, contact_info)
+            finally:
+                if self._in_flight.get(cache_key) is generation:
+                    del self._in_flight[cache_key]
+                generation.set_result(None)
+            
+            return self._finish_email(parsed_email, contact_info, email_type, internship_type), True
             
         except Exception as e:
-            self.logger.error(f"Error generating email: {str(e)}")
-            return {
-                'subject': f"Internship Application - {internship_type or 'Software Development'} at {contact_info.get('company', 'Your Company')}",
-                'body': self._get_fallback_internship_email(contact_info, email_type, internship_type),
-                'error': str(e)
-            }
+            return self._failed_email(contact_info, email_type, internship_type, e), called_api
+
+    async def aiter_personalized_email(self, 
+                                       contact_info: Dict, 
+                                       email_type: str = 'internship_application',
+                                       internship_type: str = None) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Async twin of iter_personalized_email: yields (subject, partial_body) as Gemini
+        writes it; the last tuple yielded is the final parsed email
+        """
+        
+        cache_key = self._response_cache_key(contact_info, email_type, internship_type)
+        cached_email = self._get_cached_response(cache_key, contact_info)
+        if cached_email:
+            yield cached_email['subject'], cached_email['body']
+            return
+        
+        try:
+            model, prompt = self._build_email_request(contact_info, email_type, internship_type)
+            
+            email_content = ''
+            response = await model.generate_content_async(prompt, generation_config=_GEN_CONFIG, stream=True)
+            async for chunk in response:
+                email_content += chunk.text
+                match = _EMAIL_RESPONSE_RE.search(email_content)
+                if match:
+                    subject = _MARKDOWN_EMPHASIS_RE.sub('', match['subject']).strip().strip('"\'')
+                    yield subject, match['body'].strip()
+            
+            parsed_email = self._parse_email_response(email_content)
+            self._set_cached_response(cache_key, parsed_email, contact_info)
+            
+        except Exception as e:
+            parsed_email = self._failed_email(contact_info, email_type, internship_type, e)
+        
+        yield parsed_email['subject'], parsed_email['body']
+
+    @staticmethod
+    def list_available_models() -> List[str]:
+        """List the Gemini models that support content generation (call after genai.configure)"""
+        
+        return [
+            model.name for model in genai.list_models()
+            if 'generateContent' in model.supported_generation_methods
+        ]
+
+    async def _warm_up(self):
+        """Send a one-token request so the first email does not pay connection setup"""
+        
+        try:
+            await self.model.generate_content_async('ping', generation_config={'max_output_tokens': 1})
+        except Exception as e:
+            self.logger.debug(f"Warm-up request failed: {str(e)}")
+
+    def _create_context_cache(self):
+        """Register the static prompt prefix as Gemini cached content, if enabled"""
+        
+        if os.getenv('GEMINI_CONTEXT_CACHE') != '1':
+            return
+            
+        try:
+            cache = genai.caching.CachedContent.create(
+                model=self.model.model_name,
+                display_name='agentic-coldemail-prompt',
+                system_instruction=self._static_prefix(),
+                ttl=self.context_cache_ttl
+            )
+            self.cached_model = genai.GenerativeModel.from_cached_content(cache)
+            
+            # Stop using the cache a minute before Gemini expires it
+            self._context_cache_expires = time.monotonic() + self.context_cache_ttl.total_seconds() - 60
+            self.logger.info(f"Cached static prompt prefix as {cache.name}")
+        except Exception as e:
+            # Gemini rejects caches below its minimum token count, among other reasons
+            self.logger.warning(f"Context caching unavailable, sending full prompts: {str(e)}")
+
+    async def awrite_company_emails(self, 
+                                    contacts: List[Dict], 
+                                    email_type: str = 'internship_application',
+                                    internship_type: str = None) -> List[Dict]:
+        """
+        Write emails for several contacts at one company with a single Gemini call,
+        falling back to one call per contact if the batch cannot be parsed
+        """
+        
+        try:
+            prompt = self._create_batch_prompt(contacts, internship_type)
+            response = await self.model.generate_content_async(
+                prompt,
+                generation_config=genai.types.GenerationConfig(
+                    candidate_count=1,
+                    max_output_tokens=_MAX_EMAIL_TOKENS * len(contacts),
+                    temperature=0.7,
+                    top_p=0.95,
+                    response_mime_type='application/json'
+                )
+            )
+            
+            drafts = json.loads(response.text)
+            if not isinstance(drafts, list) or len(drafts) != len(contacts):
+                raise ValueError(f"expected a JSON array of {len(contacts)} emails")
+            
+            emails = []
+            for draft, contact_info in zip(drafts, contacts):
+                # Reuse the normal parser for clean-up and the too-short fallback
+                subject = ' '.join(str(draft['subject']).split())
+                parsed_email = self._parse_email_response(f"SUBJECT: {subject}\nBODY:\n{draft['body']}")
+                emails.append(self._finish_email(parsed_email, contact_info, email_type, internship_type))
+            
+            return emails
+            
+        except Exception as e:
+            self.logger.warning(f"Batch generation failed for {contacts[0].get('company')}, writing emails one by one: {str(e)}")
+            return [
+                await self.awrite_personalized_email(contact_info, email_type, internship_type)
+                for contact_info in contacts
+            ]
+
+    def _build_email_request(self, contact_info: Dict, email_type: str, internship_type: str):
+        """Pick the model and prompt for a request: only the dynamic suffix when the prefix is cached"""
+        
+        # Get company insights
+        company_data = _COMPANY_INSIGHTS.get(contact_info.get('company', ''), _DEFAULT_COMPANY)
+        
+        if self.cached_model is not None and time.monotonic() < self._context_cache_expires:
+            return self.cached_model, self._dynamic_suffix(contact_info, internship_type, company_data)
+        
+        # Create a simplified prompt
+        return self.model, self._create_simple_prompt(
+            contact_info=contact_info,
+            email_type=email_type,
+            internship_type=internship_type,
+            company_data=company_data
+        )
+
+    def _open_disk_cache(self):
+        """Open the on-disk response cache, or None if diskcache is not installed"""
+        
+        if diskcache is None:
+            return None
+            
+        try:
+            return diskcache.Cache(os.path.join("data", ".llm_cache"))
+        except Exception as e:
+            self.logger.warning(f"Response cache unavailable: {str(e)}")
+            return None
+
+    def _response_cache_key(self, contact_info: Dict, email_type: str, internship_type: str) -> str:
+        """Hash everything except the recipient that goes into a generated email"""
+        
+        key_data = {
+            'company': contact_info.get('company', ''),
+            'email_type': email_type,
+            'internship_type': internship_type,
+            'profile': self._profile_hash,
+            'model': self.model.model_name,
+            'prompt_version': _PROMPT_VERSION
+        }
+        return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def _get_cached_response(self, cache_key: str, contact_info: Dict) -> Optional[Dict]:
+        """Return a cached email re-addressed to this recipient, or None"""
+        
+        if not self.use_cache:
+            return None
+            
+        entry = self._response_cache.get(cache_key)
+        if entry is None and self._disk_cache is not None:
+            entry = self._disk_cache.get(cache_key)
+            if entry is not None:
+                self._response_cache[cache_key] = entry
+        
+        if entry is None or not self._is_reusable_email(entry['subject'], entry['body'], entry['recipient']):
+            return None
+        
+        # Address the greeting to this recipient, whatever form Gemini used for the original one
+        _, newline, rest = entry['body'].partition('\n')
+        recipient_name = contact_info.get('name', 'Hiring Manager')
+        
+        return {'subject': entry['subject'], 'body': f"Dear {recipient_name}," + newline + rest}
+
+    @staticmethod
+    def _is_reusable_email(subject: str, body: str, recipient_name: str) -> bool:
+        """Whether an email only names its recipient in the greeting line, so it can be re-addressed"""
+        
+        greeting, _, rest = body.partition('\n')
+        if not _GREETING_RE.match(greeting.strip()):
+            return False
+        
+        # Any part of the name ("Priya", "Sharma") elsewhere would leak to the next recipient
+        name_parts = [part for part in re.split(r'[^\w]+', recipient_name) if len(part) > 1]
+        return not any(
+            re.search(rf'\b{re.escape(part)}\b', text, re.IGNORECASE)
+            for part in name_parts
+            for text in (subject, rest)
+        )
+
+    def _set_cached_response(self, cache_key: str, parsed_email: Dict, contact_info: Dict):
+        """Remember a generated email along with the recipient it was written for"""
+        
+        if not self.use_cache:
+            return
+        
+        # Unusable replies were swapped for the generic template (or kept raw); generate again next time
+        if parsed_email['body'] == self._generic_fallback_body or len(parsed_email['body']) < 50:
+            return
+            
+        entry = {
+            'subject': parsed_email['subject'],
+            'body': parsed_email['body'],
+            'recipient': contact_info.get('name', 'Hiring Manager')
+        }
+        
+        # Emails that mention the recipient beyond the greeting are specific to them
+        if not self._is_reusable_email(entry['subject'], entry['body'], entry['recipient']):
+            return
+
+        self._response_cache[cache_key] = entry
+        
+        if self._disk_cache is not None:
+            self._disk_cache.set(cache_key, entry, expire=self.response_cache_ttl.total_seconds())
+
+    def _finish_email(self, parsed_email: Dict, contact_info: Dict, email_type: str, internship_type: str) -> Dict:
+        """Attach metadata to a parsed email"""
+        
+        # Add metadata
+        parsed_email.update({
+            'generated_at': datetime.now().isoformat(),
+            'recipient': contact_info.get('name', 'Hiring Manager'),
+            'company': contact_info.get('company', 'Company'),
+            'email_type': email_type,
+            'internship_type': internship_type,
+            'confidence_score': self._calculate_confidence_score(parsed_email)
+        })
+        
+        self.logger.info(f"Generated {email_type} email for internship at {contact_info.get('company', 'Unknown Company')}")
+        
+        return parsed_email
+
+    def _failed_email(self, contact_info: Dict, email_type: str, internship_type: str, error: Exception) -> Dict:
+        """Fallback email used when Gemini generation fails"""
+        
+        self.logger.error(f"Error generating email: {str(error)}")
+        return {
+            'subject': f"Internship Application - {internship_type or 'Software Development'} at {contact_info.get('company', 'Your Company')}",
+            'body': self._get_fallback_internship_email(contact_info, email_type, internship_type),
+            'error': str(error)
+        }
 
     def _create_simple_prompt(self, contact_info: Dict, email_type: str, internship_type: str, company_data: Dict) -> str:
         """Create a simplified prompt that works better with Gemini"""
         
+        return self._static_prefix() + self._dynamic_suffix(contact_info, internship_type, company_data)
+
+    def _static_prefix(self) -> str:
+        """Instructions and student details shared by every prompt"""
+        return self._prompt_prefix
+
+    def _dynamic_suffix(self, contact_info: Dict, internship_type: str, company_data: Dict) -> str:
+        """Recipient details that change with every prompt"""
+        
         recipient_name = contact_info.get('name', 'Hiring Manager')
         company_name = contact_info.get('company', 'the company')
         
-        prompt = f"""Write a professional internship application email.
-
-STUDENT DETAILS:
-- Name: {self.user_profile['name']}
-- Status: {self.user_profile['current_role']}
-- Year: {self.user_profile['year']}
-- Skills: {self.user_profile['skills']}
-- Graduation: {self.user_profile['graduation_year']}
-
+        return f"""
 RECIPIENT:
 - Name: {recipient_name}
 - Company: {company_name}
 - Business: {company_data.get('business', 'Technology services')}
 
-INTERNSHIP TYPE: {internship_type or 'Software Development Intern'}
+INTERNSHIP TYPE: {internship_type or 'Software Development Intern'}"""
 
-Write a 150-200 word email that:
-1. Greets {recipient_name} professionally
-2. Introduces the student seeking internship
-3. Mentions specific interest in {company_name}
-4. Highlights relevant skills and projects
-5. Shows eagerness to learn
-6. Requests opportunity to discuss
-7. Ends professionally
-
-Format the response EXACTLY like this:
-SUBJECT: [Your subject line here]
-
-BODY:
-[Your email body here]
+    def _create_batch_prompt(self, contacts: List[Dict], internship_type: str) -> str:
+        """Prompt for one email per contact at the same company, answered as a JSON array"""
+        
+        company_name = contacts[0].get('company', 'the company')
+        company_data = _COMPANY_INSIGHTS.get(company_name, _DEFAULT_COMPANY)
+        recipients = json.dumps([
+            {'name': contact_info.get('name', 'Hiring Manager'), 'title': contact_info.get('title', 'HR Professional')}
+            for contact_info in contacts
+        ])
+        
+        return self._prompt_prefix + f"""
+COMPANY:
+- Name: {company_name}
+- Business: {company_data.get('business', 'Technology services')}
 
-Make it personal, enthusiastic, and professional. Focus on learning opportunity."""
+INTERNSHIP TYPE: {internship_type or 'Software Development Intern'}
 
-        return prompt
+Instead of the SUBJECT/BODY format above, write one separate email per recipient below and return them as a JSON array in the same order, where each element has "recipient", "subject", and "body" keys.
+Recipients: {recipients}"""
 
     def _parse_email_response(self, email_content: str) -> Dict:
         """Parse Gemini's response to extract subject and body - IMPROVED"""
@@ -200,39 +650,16 @@ Make it personal, enthusiastic, and professional. Focus on learning opportunity.
         try:
             content = email_content.strip()
             
-            # Initialize variables
-            subject = ""
-            body = ""
-            
-            # Split into lines and find SUBJECT and BODY sections
-            lines = content.split('\n')
-            
-            subject_found = False
-            body_found = False
-            body_lines = []
-            
-            for i, line in enumerate(lines):
-                line = line.strip()
-                
-                # Look for SUBJECT line
-                if line.upper().startswith('SUBJECT:'):
-                    subject = line[8:].strip()  # Remove "SUBJECT:"
-                    subject_found = True
-                    continue
-                
-                # Look for BODY line
-                if line.upper().startswith('BODY:'):
-                    body_found = True
-                    # Collect all lines after BODY:
-                    body_lines = [l.strip() for l in lines[i+1:] if l.strip()]
-                    break
-            
-            # If structured parsing worked
-            if subject_found and body_found:
-                body = '\n\n'.join(body_lines)
+            match = _EMAIL_RESPONSE_RE.search(content)
+            if match:
+                # Structured response: one paragraph per non-empty body line
+                subject = match['subject'].strip()
+                body = _LINE_BREAK_RE.sub('\n\n', match['body'].strip())
             else:
                 # Fallback parsing
-                all_lines = [line.strip() for line in lines if line.strip()]
+                all_lines = [line.strip() for line in content.split('\n') if line.strip()]
+                subject = ""
+                body = ""
                 
                 if all_lines:
                     # First non-empty line as subject if it's reasonably short
@@ -246,8 +673,8 @@ Make it personal, enthusiastic, and professional. Focus on learning opportunity.
                     body = '\n\n'.join(body_lines)
             
             # Clean up
-            subject = subject.replace('**', '').replace('*', '').strip('"\'')
-            body = body.replace('**', '').replace('*', '')
+            subject = _MARKDOWN_EMPHASIS_RE.sub('', subject).strip('"\'')
+            body = _MARKDOWN_EMPHASIS_RE.sub('', body)
             
             # Ensure we have content
             if not subject:
@@ -255,7 +682,7 @@ Make it personal, enthusiastic, and professional. Focus on learning opportunity.
             
             if not body or len(body) < 50:
                 # Use fallback if body is too short
-                body = self._get_fallback_internship_email({}, 'internship_application', 'Software Development')
+                body = self._generic_fallback_body
             
             return {
                 'subject': subject,
@@ -274,8 +701,10 @@ Make it personal, enthusiastic, and professional. Focus on learning opportunity.
         
         score = 0.5  # Base score
         
+        body = email_data.get('body', '')
+        
         # Check email length
-        word_count = len(email_data.get('body', '').split())
+        word_count = len(body.split())
         if 120 <= word_count <= 250:
             score += 0.2
         elif 80 <= word_count <= 300:
@@ -287,13 +716,11 @@ Make it personal, enthusiastic, and professional. Focus on learning opportunity.
             score += 0.1
         
         # Check for internship-specific indicators
-        body = email_data.get('body', '').lower()
-        internship_words = ['intern', 'learning', 'student', 'academic', 'project', 'course']
-        if any(word in body for word in internship_words):
+        if _INTERNSHIP_WORDS_RE.search(body):
             score += 0.1
         
         # Check for call-to-action
-        if any(phrase in body for phrase in ['discuss', 'chat', 'connect', 'meeting', 'opportunity']):
+        if _CALL_TO_ACTION_RE.search(body):
             score += 0.1
         
         return min(score, 1.0)
@@ -301,70 +728,97 @@ Make it personal, enthusiastic, and professional. Focus on learning opportunity.
     def _get_fallback_internship_email(self, contact_info: Dict, email_type: str, internship_type: str) -> str:
         """Fallback email template if AI generation fails"""
         
-        recipient_name = contact_info.get('name', 'Hiring Manager')
-        company_name = contact_info.get('company', 'your company')
-        
-        return f"""Dear {recipient_name},
-
-I hope this email finds you well. I am {self.user_profile['name']}, a {self.user_profile['year']} {self.user_profile['education']} student, writing to express my strong interest in software internship opportunities at {company_name}.
-
-With {self.user_profile['experience']} and skills in {self.user_profile['skills']}, I am eager to gain hands-on industry experience and contribute to {company_name}'s innovative projects in the fintech space.
-
-I am particularly excited about the opportunity to learn from your team and contribute to your mission while developing my technical skills in a real-world environment.
-
-I would be grateful for the opportunity to discuss how my academic background and passion for technology align with your internship programs.
-
-Thank you for your time and consideration. I look forward to hearing from you.
-
-Best regards,
-{self.user_profile['name']}
-{self.user_profile['current_role']}
-Expected Graduation: {self.user_profile['graduation_year']}"""
+        return self._fallback_format(
+            recipient_name=contact_info.get('name', 'Hiring Manager'),
+            company_name=contact_info.get('company', 'your company')
+        )
 
     def generate_bulk_internship_emails(self, contacts_csv: str, email_type: str = 'internship_application', 
                                       internship_type: str = 'Software Development Intern') -> List[Dict]:
         """Generate internship emails for multiple contacts from a CSV file"""
         
+        return asyncio.run(self.agenerate_bulk_internship_emails(contacts_csv, email_type, internship_type))
+
+    async def agenerate_bulk_internship_emails(self, contacts_csv: str, email_type: str = 'internship_application', 
+                                               internship_type: str = 'Software Development Intern') -> List[Dict]:
+        """Generate internship emails for multiple contacts concurrently"""
+        
+        async_client = self._bind_async_client()
         try:
             # Read contacts from CSV
             df = pd.read_csv(contacts_csv)
-            self.logger.info(f"Loaded {len(df)} contacts from {contacts_csv}")
+            total = len(df)
+            self.logger.info(f"Loaded {total} contacts from {contacts_csv}")
+            
+            # Emails are written as they complete (in contact order), so an interrupted run keeps its progress
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            os.makedirs("data", exist_ok=True)
+            filepath = os.path.join("data", f"internship_emails_{timestamp}.csv")
             
-            generated_emails = []
+            # Plain dicts with defaults for missing columns and empty cells
+            contact_defaults = {
+                'name': 'Hiring Manager',
+                'company': 'Company',
+                'title': 'HR Professional',
+                'email': '',
+                'linkedin_url': ''
+            }
+            contacts = (
+                df.reindex(columns=list(contact_defaults))
+                .fillna(contact_defaults)
+                .to_dict(orient='records')
+            )
             
-            for index, contact in df.iterrows():
-                self.logger.info(f"Generating internship email {index + 1}/{len(df)} for {contact.get('company', 'Unknown')}")
-                
-                contact_info = {
-                    'name': contact.get('name', 'Hiring Manager'),
-                    'company': contact.get('company', 'Company'),
-                    'title': contact.get('title', 'HR Professional'),
-                    'email': contact.get('email', ''),
-                    'linkedin_url': contact.get('linkedin_url', '')
-                }
-                
-                email_data = self.write_personalized_email(
-                    contact_info=contact_info,
-                    email_type=email_type,
-                    internship_type=internship_type
-                )
+            # Up to max_concurrent_requests calls in flight; each slot pauses after its call
+            semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+            generated_emails = [None] * total
+            completed = 0
+            # Rows are written in contact order (the sender sends in file order), so finished
+            # emails wait here until every earlier contact's email is done
+            next_to_write = 0
+            
+            with open(filepath, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=self.generated_email_columns, restval='', extrasaction='ignore')
+                writer.writeheader()
                 
-                # Add contact info to email data
-                email_data.update(contact_info)
-                generated_emails.append(email_data)
+                async def generate(indices: List[int]):
+                    nonlocal completed, next_to_write
+                    batch = [contacts[i] for i in indices]
+                    
+                    async with semaphore:
+                        if len(batch) > 1:
+                            self.logger.info(f"Generating {len(batch)} internship emails for {batch[0]['company']} in one request")
+                            emails = await self.awrite_company_emails(batch, email_type, internship_type)
+                            called_api = True
+                        else:
+                            self.logger.info(f"Generating internship email {indices[0] + 1}/{total} for {batch[0]['company']}")
+                            email_data, called_api = await self._awrite_email(batch[0], email_type, internship_type)
+                            emails = [email_data]
+                        
+                        for i, contact_info, email_data in zip(indices, batch, emails):
+                            # Add contact info to email data
+                            email_data.update(contact_info)
+                            generated_emails[i] = email_data
+                        
+                        while next_to_write < total and generated_emails[next_to_write] is not None:
+                            writer.writerow(generated_emails[next_to_write])
+                            next_to_write += 1
+                        f.flush()
+                        
+                        # Rate limiting to be respectful to the API (cache hits made no request)
+                        if called_api:
+                            await asyncio.sleep(self.request_delay)
+                    
+                    # Progress indicator
+                    for _ in batch:
+                        completed += 1
+                        if completed % 5 == 0:
+                            self.logger.info(f"Completed {completed}/{total} emails...")
                 
-                # Rate limiting to be respectful to the API
-                import time
-                time.sleep(3)  # 3 second delay between requests
+                if self.warm_up:
+                    await self._warm_up()
                 
-                # Progress indicator
-                if (index + 1) % 5 == 0:
-                    self.logger.info(f"Completed {index + 1}/{len(df)} emails...")
-            
-            # Save generated emails
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"internship_emails_{timestamp}.csv"
-            filepath = self._save_generated_emails(generated_emails, filename)
+                await asyncio.gather(*[generate(indices) for indices in self._plan_generation_batches(contacts)])
             
             self.logger.info(f"✅ Successfully generated {len(generated_emails)} internship emails")
             self.logger.info(f"📁 Emails saved to: {filepath}")
@@ -374,6 +828,43 @@ Expected Graduation: {self.user_profile['graduation_year']}"""
         except Exception as e:
             self.logger.error(f"Error generating bulk internship emails: {str(e)}")
             return []
+            
+        finally:
+            await self._release_async_client(async_client)
+
+    def _bind_async_client(self):
+        """Give the models a new async client; grpc.aio channels only work on the loop that opened them"""
+        
+        async_client = glm.GenerativeServiceAsyncClient(client_options=self._client_options)
+        for model in (self.model, self.cached_model):
+            if model is not None:
+                model._async_client = async_client
+        return async_client
+
+    async def _release_async_client(self, async_client):
+        """Close a run's async client and let the models pick a client lazily again"""
+        
+        for model in (self.model, self.cached_model):
+            if model is not None and model._async_client is async_client:
+                model._async_client = None
+        await async_client.transport.close()
+
+    def _plan_generation_batches(self, contacts: List[Dict]) -> List[List[int]]:
+        """Group contact indices into Gemini calls: same-company batches when emails are not cached"""
+        
+        # With the response cache on, repeat companies are already served from one generation
+        if self.use_cache:
+            return [[i] for i in range(len(contacts))]
+        
+        by_company: Dict[str, List[int]] = {}
+        for i, contact_info in enumerate(contacts):
+            by_company.setdefault(contact_info['company'], []).append(i)
+        
+        return [
+            indices[start:start + self.company_batch_size]
+            for indices in by_company.values()
+            for start in range(0, len(indices), self.company_batch_size)
+        ]
 
     def _save_generated_emails(self, emails: List[Dict], filename: str = None):
         """Save generated emails to CSV"""